@@ -62,6 +62,8 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     await coordinator.async_config_entry_first_refresh()
 
     hass.data[DOMAIN][entry.entry_id] = coordinator
+    entry.async_on_unload(coordinator.notifications.async_track_services())
+    entry.async_on_unload(coordinator.notifications.async_flush_pending)
 
     # Set up services
     _log.debug("Registering services")
@@ -135,6 +137,7 @@ async def async_update_options(hass: HomeAssistant, entry: ConfigEntry) -> None:
     
     coordinator: RoutinelyCoordinator = hass.data[DOMAIN][entry.entry_id]
     await coordinator.storage.async_update_settings(dict(entry.options))
+    coordinator.engine.refresh_settings()
     _log.info("Routinely options updated")
 
 
@@ -148,6 +151,9 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         _log.debug("Cancelling active routine before unload")
         await coordinator.cancel()
 
+    # Write any coalesced storage changes before the entry goes away
+    await coordinator.storage.async_flush()
+
     # Unload platforms
     _log.debug("Unloading platforms")
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
@@ -15,6 +15,7 @@ from .logger import Loggers
 if TYPE_CHECKING:
     from homeassistant.config_entries import ConfigEntry
     from homeassistant.core import HomeAssistant
+    from homeassistant.helpers.device_registry import DeviceInfo
     from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
     from .coordinator import RoutinelyCoordinator
@@ -31,10 +32,17 @@ async def async_setup_entry(
     _log.debug("Setting up binary sensor entities")
     coordinator: RoutinelyCoordinator = hass.data[DOMAIN][entry.entry_id]
 
+    device_info: DeviceInfo = {
+        "identifiers": {(DOMAIN, entry.entry_id)},
+        "name": "Routinely",
+        "manufacturer": "Routinely",
+        "model": "Timer-Guided Routine Execution",
+    }
+
     entities = [
-        RoutinelyActiveSensor(coordinator, entry),
-        RoutinelyPausedSensor(coordinator, entry),
-        RoutinelyAwaitingInputSensor(coordinator, entry),
+        RoutinelyActiveSensor(coordinator, entry, device_info),
+        RoutinelyPausedSensor(coordinator, entry, device_info),
+        RoutinelyAwaitingInputSensor(coordinator, entry, device_info),
     ]
     async_add_entities(entities)
     _log.debug("Binary sensor entities registered", count=len(entities))
@@ -49,20 +57,15 @@ class RoutinelyBaseBinarySensor(CoordinatorEntity, BinarySensorEntity):
         self,
         coordinator: RoutinelyCoordinator,
         entry: ConfigEntry,
+        device_info: DeviceInfo,
         name: str,
         key: str,
     ) -> None:
         """Initialize the binary sensor."""
         super().__init__(coordinator)
-        self._key = key
         self._attr_name = name
         self._attr_unique_id = f"{entry.entry_id}_{key}"
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, entry.entry_id)},
-            "name": "Routinely",
-            "manufacturer": "Routinely",
-            "model": "Timer-Guided Routine Execution",
-        }
+        self._attr_device_info = device_info
 
 
 class RoutinelyActiveSensor(RoutinelyBaseBinarySensor):
@@ -71,9 +74,14 @@ class RoutinelyActiveSensor(RoutinelyBaseBinarySensor):
     _attr_device_class = BinarySensorDeviceClass.RUNNING
     _attr_icon = "mdi:play-circle"
 
-    def __init__(self, coordinator: RoutinelyCoordinator, entry: ConfigEntry) -> None:
+    def __init__(
+        self,
+        coordinator: RoutinelyCoordinator,
+        entry: ConfigEntry,
+        device_info: DeviceInfo,
+    ) -> None:
         """Initialize the active sensor."""
-        super().__init__(coordinator, entry, "Active", "active")
+        super().__init__(coordinator, entry, device_info, "Active", "active")
 
     @property
     def is_on(self) -> bool:
@@ -98,9 +106,14 @@ class RoutinelyPausedSensor(RoutinelyBaseBinarySensor):
 
     _attr_icon = "mdi:pause-circle"
 
-    def __init__(self, coordinator: RoutinelyCoordinator, entry: ConfigEntry) -> None:
+    def __init__(
+        self,
+        coordinator: RoutinelyCoordinator,
+        entry: ConfigEntry,
+        device_info: DeviceInfo,
+    ) -> None:
         """Initialize the paused sensor."""
-        super().__init__(coordinator, entry, "Paused", "paused")
+        super().__init__(coordinator, entry, device_info, "Paused", "paused")
 
     @property
     def is_on(self) -> bool:
@@ -113,9 +126,14 @@ class RoutinelyAwaitingInputSensor(RoutinelyBaseBinarySensor):
 
     _attr_icon = "mdi:account-question"
 
-    def __init__(self, coordinator: RoutinelyCoordinator, entry: ConfigEntry) -> None:
+    def __init__(
+        self,
+        coordinator: RoutinelyCoordinator,
+        entry: ConfigEntry,
+        device_info: DeviceInfo,
+    ) -> None:
         """Initialize the awaiting input sensor."""
-        super().__init__(coordinator, entry, "Awaiting Input", "awaiting_input")
+        super().__init__(coordinator, entry, device_info, "Awaiting Input", "awaiting_input")
 
     @property
     def is_on(self) -> bool:
@@ -1,6 +1,7 @@
 """Config flow for the Routinely integration."""
 from __future__ import annotations
 
+from collections.abc import Sequence
 import logging
 from typing import Any
 
@@ -17,6 +18,7 @@ from .const import (
     CONF_ENABLE_NOTIFICATIONS,
     CONF_ENABLE_TTS,
     CONF_LOG_LEVEL,
+    CONF_NOTIFICATION_BATCH_WINDOW,
     CONF_NOTIFICATION_TARGETS,
     CONF_NOTIFY_BEFORE,
     CONF_NOTIFY_ON_START,
@@ -27,6 +29,7 @@ from .const import (
     CONF_TTS_ENTITY,
     DEFAULT_ADVANCEMENT_MODE,
     DEFAULT_LOG_LEVEL,
+    DEFAULT_NOTIFICATION_BATCH_WINDOW,
     DEFAULT_NOTIFY_BEFORE,
     DEFAULT_NOTIFY_ON_COMPLETE,
     DEFAULT_NOTIFY_ON_START,
@@ -99,7 +102,7 @@ class RoutinelyConfigFlow(ConfigFlow, domain=DOMAIN):
         return RoutinelyOptionsFlow(config_entry)
 
 
-def _list_to_str(values: list[int]) -> str:
+def _list_to_str(values: Sequence[int]) -> str:
     """Convert list of seconds to comma-separated minutes."""
     return ",".join(str(v // 60) for v in values)
 
@@ -328,6 +331,13 @@ class RoutinelyOptionsFlow(OptionsFlow):
                         CONF_ENABLE_HA_PERSISTENT,
                         default=options.get(CONF_ENABLE_HA_PERSISTENT, False),
                     ): bool,
+                    vol.Optional(
+                        CONF_NOTIFICATION_BATCH_WINDOW,
+                        default=options.get(
+                            CONF_NOTIFICATION_BATCH_WINDOW,
+                            DEFAULT_NOTIFICATION_BATCH_WINDOW,
+                        ),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=0, max=1000)),
                     vol.Optional(
                         CONF_LOG_LEVEL,
                         default=options.get(CONF_LOG_LEVEL, DEFAULT_LOG_LEVEL),
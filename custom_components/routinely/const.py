@@ -150,14 +150,19 @@ CONF_NOTIFY_OVERDUE: Final = "notify_overdue"  # List of seconds overdue
 CONF_NOTIFY_ON_COMPLETE: Final = "notify_on_complete"
 
 # Default notification timings (in seconds)
-DEFAULT_NOTIFY_BEFORE: Final = [600, 300, 60]  # 10, 5, 1 min before
-DEFAULT_NOTIFY_REMAINING: Final = [300, 60]  # 5, 1 min remaining  
-DEFAULT_NOTIFY_OVERDUE: Final = [60, 300, 600]  # 1, 5, 10 min overdue
+DEFAULT_NOTIFY_BEFORE: Final = (600, 300, 60)  # 10, 5, 1 min before
+DEFAULT_NOTIFY_REMAINING: Final = (300, 60)  # 5, 1 min remaining  
+DEFAULT_NOTIFY_OVERDUE: Final = (60, 300, 600)  # 1, 5, 10 min overdue
 DEFAULT_NOTIFY_ON_START: Final = True
 DEFAULT_NOTIFY_ON_COMPLETE: Final = False
 
 # Auto-next specific notification timings
 CONF_AUTONEXT_NOTIFY_BEFORE: Final = "autonext_notify_before"
 CONF_AUTONEXT_NOTIFY_REMAINING: Final = "autonext_notify_remaining"
-DEFAULT_AUTONEXT_NOTIFY_BEFORE: Final = [300, 60]  # 5, 1 min before
-DEFAULT_AUTONEXT_NOTIFY_REMAINING: Final = [60]  # 1 min remaining
+DEFAULT_AUTONEXT_NOTIFY_BEFORE: Final = (300, 60)  # 5, 1 min before
+DEFAULT_AUTONEXT_NOTIFY_REMAINING: Final = (60,)  # 1 min remaining
+
+# Push notifications queued within this window (milliseconds) are sent together,
+# keeping only the newest of each type per target. Critical ones skip the wait.
+CONF_NOTIFICATION_BATCH_WINDOW: Final = "notification_batch_window"
+DEFAULT_NOTIFICATION_BATCH_WINDOW: Final = 50
@@ -31,6 +31,9 @@ class RoutinelyCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             _std_logger,
             name=DOMAIN,
             update_interval=timedelta(seconds=1),
+            # The poll rebuilds an equal dict whenever nothing has changed
+            # (always while idle), so only notify listeners on a difference.
+            always_update=False,
         )
         self.storage = storage
         self.notifications = RoutinelyNotifications(hass, storage)
@@ -71,15 +74,17 @@ class RoutinelyCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                 "current_task_name": None,
                 "current_task_duration": 0,
                 "time_remaining": 0,
+                "time_remaining_formatted": "0:00",
                 "elapsed_time": 0,
                 "completed_tasks": 0,
                 "skipped_tasks": 0,
                 "total_tasks": 0,
                 "progress_percent": 0,
                 "confirm_window_active": False,
+                "revision": self.storage.revision,
             }
 
-        routine = self.storage.get_routine(session.routine_id)
+        routine = self.engine.routine
         task = self.engine.get_current_task()
         completed, skipped, total, active_total = self.engine.get_progress()
         active_task_index = self.engine.get_active_task_index()
@@ -114,6 +119,7 @@ class RoutinelyCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             "progress_percent": progress_percent,
             "confirm_window_active": session.confirm_window_active,
             "started_at": session.started_at,
+            "revision": self.storage.revision,
         }
 
     @staticmethod
@@ -3,7 +3,8 @@ from __future__ import annotations
 
 import asyncio
 from datetime import datetime
-from typing import TYPE_CHECKING, Callable
+import time
+from typing import TYPE_CHECKING, Any, Callable
 
 from .const import (
     ATTR_ACTUAL_DURATION,
@@ -25,6 +26,7 @@ from .const import (
     CONF_NOTIFY_REMAINING,
     CONF_AUTONEXT_NOTIFY_BEFORE,
     CONF_AUTONEXT_NOTIFY_REMAINING,
+    CONF_TASK_ENDING_WARNING,
     DEFAULT_AUTONEXT_NOTIFY_BEFORE,
     DEFAULT_AUTONEXT_NOTIFY_REMAINING,
     DEFAULT_CONFIRM_WINDOW,
@@ -68,6 +70,16 @@ if TYPE_CHECKING:
 
 _log = Loggers.engine
 
+# How far the current task's own deadlines have got; ending soon chains into expiry
+_STAGE_RUNNING = 0
+_STAGE_ENDING_SOON = 1
+_STAGE_EXPIRED = 2
+
+
+def _now_iso(now: float | None = None) -> str:
+    """Format an epoch timestamp (default: now) for session fields."""
+    return datetime.fromtimestamp(now if now is not None else time.time()).isoformat()
+
 
 class RoutineEngine:
     """Engine for executing routines."""
@@ -84,17 +96,37 @@ class RoutineEngine:
         self.storage = storage
         self.notifications = notifications
         self._update_callback = update_callback
+        self._update_pending = False
         self._session: ExecutionSession | None = None
-        self._timer_task: asyncio.Task | None = None
-        self._ending_soon_fired = False
-        self._task_timer_expired = False
-
-    def _notifications_enabled(self) -> bool:
-        """Check if notifications are enabled."""
-        return (
+        # Routine and its tasks in session order, resolved once at start
+        self._routine: Routine | None = None
+        self._tasks: list[Task] = []
+        # Task at the session's current index, set whenever the index moves
+        self._current_task: Task | None = None
+        # Event payload fields shared by every event about the routine / current task
+        self._routine_payload: dict[str, str] = {}
+        self._task_payload: dict[str, str] = {}
+        # Pending deadlines for the current task, and the loop time they count from
+        self._timer_handles: list[asyncio.TimerHandle] = []
+        self._deadline_anchor: float | None = None
+        self._task_stage = _STAGE_RUNNING
+        self._warning_time: int = DEFAULT_TASK_ENDING_WARNING
+        self._notifications_on = False
+        self.refresh_settings()
+
+    def refresh_settings(self) -> None:
+        """Re-read cached settings after they change in storage."""
+        self._notifications_on = bool(
             self.notifications is not None
             and self.storage.get_setting(CONF_ENABLE_NOTIFICATIONS, True)
         )
+        self._warning_time = self.storage.get_setting(
+            CONF_TASK_ENDING_WARNING, DEFAULT_TASK_ENDING_WARNING
+        )
+
+    def _notifications_enabled(self) -> bool:
+        """Check if notifications are enabled."""
+        return self._notifications_on
 
     def _get_notification_settings(self, routine: Routine | None = None) -> NotificationSettings:
         """Get notification settings, using routine override if present."""
@@ -113,11 +145,25 @@ class RoutineEngine:
             autonext_notify_remaining=self.storage.get_setting(CONF_AUTONEXT_NOTIFY_REMAINING, DEFAULT_AUTONEXT_NOTIFY_REMAINING),
         )
 
+    def _set_current_task(self, task: Task) -> None:
+        """Cache the task being entered and its base event payload."""
+        self._current_task = task
+        self._task_payload = {
+            ATTR_ROUTINE_ID: self._session.routine_id,
+            ATTR_TASK_ID: task.id,
+            ATTR_TASK_NAME: task.name,
+        }
+
     @property
     def session(self) -> ExecutionSession | None:
         """Return the current session."""
         return self._session
 
+    @property
+    def routine(self) -> Routine | None:
+        """Return the routine being executed, as loaded when it started."""
+        return self._routine
+
     @property
     def is_active(self) -> bool:
         """Return True if a routine is currently active."""
@@ -135,22 +181,20 @@ class RoutineEngine:
         """Get the current task being executed."""
         if not self._session:
             return None
-        # Use session's task_ids for ordering
-        if self._session.current_task_index < len(self._session.task_ids):
-            task_id = self._session.task_ids[self._session.current_task_index]
-            return self.storage.get_task(task_id)
-        return None
-    
-    def _get_session_tasks(self) -> list[Task]:
-        """Get tasks for current session in session order."""
-        if not self._session:
-            return []
-        tasks = []
-        for task_id in self._session.task_ids:
-            task = self.storage.get_task(task_id)
-            if task:
-                tasks.append(task)
-        return tasks
+        if self._current_task is None:
+            index = self._session.current_task_index
+            if 0 <= index < len(self._tasks):
+                self._current_task = self._tasks[index]
+        return self._current_task
+
+    def _end_session(self) -> None:
+        """Drop the finished session and everything cached for it."""
+        self._session = None
+        self._routine = None
+        self._tasks = []
+        self._routine_payload = {}
+        self._task_payload = {}
+        self._current_task = None
 
     def get_time_remaining(self) -> int:
         """Get remaining time for current task in seconds.
@@ -163,6 +207,8 @@ class RoutineEngine:
         if not task:
             return 0
 
+        self._sync_elapsed()
+
         if self._session.confirm_window_active:
             return self._session.confirm_window_remaining
 
@@ -181,34 +227,19 @@ class RoutineEngine:
         """
         if not self._session:
             return (0, 0, 0, 0)
-        completed = sum(
-            1
-            for ts in self._session.task_states
-            if ts.status == TaskStatus.COMPLETED
-        )
-        skipped = sum(
-            1 for ts in self._session.task_states if ts.status == TaskStatus.SKIPPED
-        )
-        # Count tasks that are not pre-skipped (either active, pending, or completed during execution)
-        # Pre-skipped tasks have status SKIPPED but no started_at time
-        active_total = sum(
-            1 for ts in self._session.task_states
-            if ts.status != TaskStatus.SKIPPED or ts.started_at is not None
+        session = self._session
+        return (
+            session.count_status(TaskStatus.COMPLETED),
+            session.count_status(TaskStatus.SKIPPED),
+            len(session.task_states),
+            session.active_before[-1],
         )
-        return (completed, skipped, len(self._session.task_states), active_total)
     
     def get_active_task_index(self) -> int:
         """Get current task index relative to non-pre-skipped tasks only."""
         if not self._session:
             return 0
-        # Count how many non-skipped tasks come before current index
-        active_index = 0
-        for i in range(self._session.current_task_index):
-            ts = self._session.task_states[i]
-            # Only count if it wasn't pre-skipped (was started at some point)
-            if ts.status != TaskStatus.SKIPPED or ts.started_at is not None:
-                active_index += 1
-        return active_index
+        return self._session.active_before[self._session.current_task_index]
 
     async def start_routine(
         self, 
@@ -260,60 +291,63 @@ class RoutineEngine:
             return False
 
         skip_task_ids = skip_task_ids or []
+        skip_set = frozenset(skip_task_ids)
+        self.refresh_settings()
 
         # Create new session
-        now = datetime.now().isoformat()
+        now = time.time()
         task_states = []
-        task_ids = [t.id for t in tasks]  # Store ordered task IDs
-        for t in tasks:
-            state = TaskState(task_id=t.id)
-            if t.id in skip_task_ids:
-                state.status = TaskStatus.SKIPPED
-                state.skipped_at = now
-            task_states.append(state)
-        
+        task_ids = []  # Store ordered task IDs
+        # Single pass: build states, find the first non-skipped task and count skips
+        first_active_index: int | None = None
+        skipped_count = 0
+        for i, t in enumerate(tasks):
+            task_ids.append(t.id)
+            if t.id in skip_set:
+                task_states.append(
+                    TaskState(task_id=t.id, status=TaskStatus.SKIPPED, skipped_at=now)
+                )
+                skipped_count += 1
+            else:
+                task_states.append(TaskState(task_id=t.id))
+                if first_active_index is None:
+                    first_active_index = i
+
+        self._current_task = None
+        self._routine = routine
+        self._tasks = tasks
+        self._routine_payload = {ATTR_ROUTINE_ID: routine_id, ATTR_ROUTINE_NAME: routine.name}
         self._session = ExecutionSession(
             id=generate_id(),
             routine_id=routine_id,
             status=SessionStatus.RUNNING,
-            current_task_index=0,
+            current_task_index=first_active_index or 0,
             task_states=task_states,
             task_ids=task_ids,
-            started_at=now,
+            started_at=_now_iso(now),
             elapsed_time=0,
             task_elapsed_time=0,
         )
 
-        # Find first non-skipped task
-        first_active_index = 0
-        for i, state in enumerate(self._session.task_states):
-            if state.status != TaskStatus.SKIPPED:
-                first_active_index = i
-                break
-        
-        self._session.current_task_index = first_active_index
-        
-        # Check if all tasks were skipped
-        if all(s.status == TaskStatus.SKIPPED for s in self._session.task_states):
+        if first_active_index is None:
             _log.warning("All tasks were skipped, completing routine immediately")
             self._session.status = SessionStatus.COMPLETED
-            self._fire_event(EVENT_ROUTINE_COMPLETED, {ATTR_ROUTINE_ID: routine_id})
+            self.hass.bus.async_fire(EVENT_ROUTINE_COMPLETED, {ATTR_ROUTINE_ID: routine_id})
             self._notify_update()
             return True
 
         # Mark first active task as active
-        self._session.task_states[first_active_index].status = TaskStatus.ACTIVE
-        self._session.task_states[first_active_index].started_at = now
+        self._session.set_task_status(first_active_index, TaskStatus.ACTIVE).started_at = now
+        self._set_current_task(tasks[first_active_index])
 
         # Count active tasks (not pre-skipped)
-        active_task_count = sum(1 for s in self._session.task_states if s.status != TaskStatus.SKIPPED or s.task_id == tasks[first_active_index].id)
+        active_task_count = len(tasks) - skipped_count
         
         # Fire events
-        self._fire_event(
+        self.hass.bus.async_fire(
             EVENT_ROUTINE_STARTED,
             {
-                ATTR_ROUTINE_ID: routine_id,
-                ATTR_ROUTINE_NAME: routine.name,
+                **self._routine_payload,
                 ATTR_TOTAL_TASKS: active_task_count,
                 "skipped_tasks": len(skip_task_ids),
             },
@@ -329,20 +363,27 @@ class RoutineEngine:
             self.notifications.set_active_routine_targets(settings.notification_targets)
         
         if self._notifications_enabled():
-            await self.notifications.notify_routine_started(
-                routine=routine,
-                total_tasks=active_task_count,
-                estimated_duration=estimated_duration,
-            )
+            sends = [
+                self.notifications.notify_routine_started(
+                    routine=routine,
+                    total_tasks=active_task_count,
+                    estimated_duration=estimated_duration,
+                )
+            ]
             if settings.notify_on_start:
-                await self.notifications.notify_task_started(
-                    task=tasks[first_active_index],
-                    routine_name=routine.name,
-                    task_index=first_active_index,
-                    total_tasks=len(tasks),
+                sends.append(
+                    self.notifications.notify_task_started(
+                        task=tasks[first_active_index],
+                        routine_name=routine.name,
+                        task_index=first_active_index,
+                        total_tasks=len(tasks),
+                    )
                 )
                 # Mark as sent
                 self._session.task_states[first_active_index].sent_start_notification = True
+            # Don't hold up the first task's timer on TTS/push delivery
+            for send in sends:
+                self.hass.async_create_task(send, eager_start=True)
 
         # Start timer
         self._start_timer()
@@ -368,20 +409,16 @@ class RoutineEngine:
 
         self._stop_timer()
         self._session.status = SessionStatus.PAUSED
-        self._session.paused_at = datetime.now().isoformat()
+        self._session.paused_at = _now_iso()
 
-        routine = self.storage.get_routine(self._session.routine_id)
-        self._fire_event(
-            EVENT_ROUTINE_PAUSED,
-            {
-                ATTR_ROUTINE_ID: self._session.routine_id,
-                ATTR_ROUTINE_NAME: routine.name if routine else "",
-            },
-        )
+        routine = self._routine
+        self.hass.bus.async_fire(EVENT_ROUTINE_PAUSED, {**self._routine_payload})
 
         # Send notification
         if self._notifications_enabled() and routine:
-            await self.notifications.notify_routine_paused(routine)
+            self.hass.async_create_task(
+                self.notifications.notify_routine_paused(routine), eager_start=True
+            )
 
         self._notify_update()
 
@@ -403,20 +440,17 @@ class RoutineEngine:
         self._session.status = SessionStatus.RUNNING
         self._session.paused_at = None
 
-        routine = self.storage.get_routine(self._session.routine_id)
-        self._fire_event(
-            EVENT_ROUTINE_RESUMED,
-            {
-                ATTR_ROUTINE_ID: self._session.routine_id,
-                ATTR_ROUTINE_NAME: routine.name if routine else "",
-            },
-        )
+        routine = self._routine
+        self.hass.bus.async_fire(EVENT_ROUTINE_RESUMED, {**self._routine_payload})
 
         # Send notification
         if self._notifications_enabled() and routine:
             task = self.get_current_task()
             if task:
-                await self.notifications.notify_routine_resumed(routine, task)
+                self.hass.async_create_task(
+                    self.notifications.notify_routine_resumed(routine, task),
+                    eager_start=True,
+                )
 
         self._start_timer()
         self._notify_update()
@@ -433,19 +467,15 @@ class RoutineEngine:
             return False
 
         task = self.get_current_task()
-        current_state = self._session.task_states[self._session.current_task_index]
-        current_state.status = TaskStatus.SKIPPED
-        current_state.completed_at = datetime.now().isoformat()
+        self._sync_elapsed()
+        now = time.time()
+        current_state = self._session.set_task_status(
+            self._session.current_task_index, TaskStatus.SKIPPED
+        )
+        current_state.completed_at = now
         current_state.actual_duration = self._session.task_elapsed_time
 
-        self._fire_event(
-            EVENT_TASK_SKIPPED,
-            {
-                ATTR_ROUTINE_ID: self._session.routine_id,
-                ATTR_TASK_ID: task.id if task else "",
-                ATTR_TASK_NAME: task.name if task else "",
-            },
-        )
+        self.hass.bus.async_fire(EVENT_TASK_SKIPPED, {**self._task_payload})
 
         _log.info(
             "Task skipped",
@@ -454,7 +484,7 @@ class RoutineEngine:
             elapsed=self._session.task_elapsed_time,
         )
 
-        await self._advance_to_next_task()
+        await self._advance_to_next_task(now)
         return True
 
     def adjust_task_time(self, seconds: int) -> bool:
@@ -475,6 +505,9 @@ class RoutineEngine:
             _log.debug("Cannot adjust time: no current task")
             return False
         
+        # Pending deadlines have to move with the adjustment
+        anchor = self._stop_timer()
+
         # Calculate new elapsed time (subtracting seconds adds time, adding reduces remaining)
         new_elapsed = self._session.task_elapsed_time - seconds
         
@@ -486,6 +519,8 @@ class RoutineEngine:
             new_elapsed = min_elapsed
         
         self._session.task_elapsed_time = new_elapsed
+        if self._session.status == SessionStatus.RUNNING:
+            self._start_timer(anchor)
         self._notify_update()
         
         _log.info(
@@ -520,7 +555,7 @@ class RoutineEngine:
             return False
 
         _log.info("Task manually completed", task_id=task.id, task_name=task.name)
-        await self._complete_current_task(auto_advanced=False)
+        await self._complete_current_task(auto_advanced=False, task=task)
         return True
 
     async def confirm(self) -> bool:
@@ -535,7 +570,7 @@ class RoutineEngine:
         _log.info("Task confirmed", task_id=task.id if task else None)
         
         self._session.confirm_window_active = False
-        await self._complete_current_task(auto_advanced=False)
+        await self._complete_current_task(auto_advanced=False, task=task)
         return True
 
     async def snooze(self, seconds: int = DEFAULT_SNOOZE_DURATION) -> bool:
@@ -546,7 +581,10 @@ class RoutineEngine:
             _log.debug("Cannot snooze: no confirm window active")
             return False
 
+        anchor = self._stop_timer()
         self._session.confirm_window_remaining += seconds
+        if self._session.status == SessionStatus.RUNNING:
+            self._start_timer(anchor)
         _log.info(
             "Confirm window snoozed",
             added_seconds=seconds,
@@ -565,31 +603,27 @@ class RoutineEngine:
 
         self._stop_timer()
 
-        routine = self.storage.get_routine(self._session.routine_id)
+        routine = self._routine
         routine_id = self._session.routine_id
         elapsed = self._session.elapsed_time
         
         self._session.status = SessionStatus.CANCELLED
-        self._session.completed_at = datetime.now().isoformat()
+        self._session.completed_at = _now_iso()
 
         # Save to history
-        await self._save_to_history()
+        self._save_to_history()
 
-        self._fire_event(
-            EVENT_ROUTINE_CANCELLED,
-            {
-                ATTR_ROUTINE_ID: routine_id,
-                ATTR_ROUTINE_NAME: routine.name if routine else "",
-            },
-        )
+        self.hass.bus.async_fire(EVENT_ROUTINE_CANCELLED, {**self._routine_payload})
 
         # Send notification and clear routine targets
         if self._notifications_enabled() and routine:
-            await self.notifications.notify_routine_cancelled(routine)
-            await self.notifications.clear_notifications()
+            await asyncio.gather(
+                self.notifications.notify_routine_cancelled(routine),
+                self.notifications.clear_notifications(),
+            )
             self.notifications.clear_active_routine_targets()
 
-        self._session = None
+        self._end_session()
         self._notify_update()
 
         _log.info(
@@ -600,15 +634,29 @@ class RoutineEngine:
         )
         return True
 
-    async def _complete_current_task(self, auto_advanced: bool) -> None:
-        """Complete the current task and advance."""
+    async def _complete_current_task(
+        self, auto_advanced: bool, task: Task | None = None
+    ) -> None:
+        """Complete the current task and advance.
+
+        A timer expiry passes the task it fired for; if a service call has
+        already moved past it, or paused the routine, there is nothing to do.
+        """
         if not self._session:
             return
 
-        task = self.get_current_task()
-        current_state = self._session.task_states[self._session.current_task_index]
-        current_state.status = TaskStatus.COMPLETED
-        current_state.completed_at = datetime.now().isoformat()
+        current = self.get_current_task()
+        if task is not None and task is not current:
+            return
+        if auto_advanced and self._session.status != SessionStatus.RUNNING:
+            return
+        task = current
+        self._sync_elapsed()
+        now = time.time()
+        current_state = self._session.set_task_status(
+            self._session.current_task_index, TaskStatus.COMPLETED
+        )
+        current_state.completed_at = now
         current_state.actual_duration = self._session.task_elapsed_time
         current_state.was_auto_advanced = auto_advanced
 
@@ -620,12 +668,10 @@ class RoutineEngine:
             actual_duration=current_state.actual_duration,
         )
 
-        self._fire_event(
+        self.hass.bus.async_fire(
             EVENT_TASK_COMPLETED,
             {
-                ATTR_ROUTINE_ID: self._session.routine_id,
-                ATTR_TASK_ID: task.id if task else "",
-                ATTR_TASK_NAME: task.name if task else "",
+                **self._task_payload,
                 ATTR_WAS_AUTO_ADVANCED: auto_advanced,
                 ATTR_ACTUAL_DURATION: current_state.actual_duration,
             },
@@ -633,27 +679,34 @@ class RoutineEngine:
 
         # Send task completion notification if enabled
         if self._notifications_enabled() and task:
-            routine = self.storage.get_routine(self._session.routine_id)
-            settings = self._get_notification_settings(routine)
+            settings = self._get_notification_settings(self._routine)
             if settings.notify_on_complete and not current_state.sent_complete_notification:
                 current_state.sent_complete_notification = True
-                await self.notifications.notify_task_complete(task)
+                self.hass.async_create_task(
+                    self.notifications.notify_task_complete(task), eager_start=True
+                )
+
+        await self._advance_to_next_task(now)
 
-        await self._advance_to_next_task()
+    async def _advance_to_next_task(self, now: float | None = None) -> None:
+        """Advance to the next task or complete routine.
 
-    async def _advance_to_next_task(self) -> None:
-        """Advance to the next task or complete routine."""
+        Args:
+            now: Epoch timestamp of the transition, shared with the caller so
+                 a single transition is stamped only once
+        """
         if not self._session:
             return
 
+        now = now or time.time()
+
         self._stop_timer()
         self._session.confirm_window_active = False
-        self._ending_soon_fired = False
-        self._task_timer_expired = False
+        self._task_stage = _STAGE_RUNNING
 
         next_index = self._session.current_task_index + 1
-        routine = self.storage.get_routine(self._session.routine_id)
-        tasks = self._get_session_tasks()
+        routine = self._routine
+        tasks = self._tasks
 
         _log.debug(
             "Advancing to next task",
@@ -664,31 +717,27 @@ class RoutineEngine:
         if next_index >= len(tasks):
             # Routine complete
             _log.debug("All tasks complete, finishing routine")
-            await self._complete_routine()
+            await self._complete_routine(now)
             return
 
         # Move to next task, skipping any pre-skipped tasks
-        while next_index < len(tasks):
-            current_state = self._session.task_states[next_index]
-            # If this task was pre-skipped in review, skip over it
-            if current_state.status == TaskStatus.SKIPPED:
-                _log.debug("Skipping pre-skipped task", task_index=next_index)
-                next_index += 1
-                continue
-            break
-        
+        first_index = next_index
+        next_index = self._session.next_unskipped(next_index)
+        if next_index > first_index:
+            _log.debug("Skipping pre-skipped tasks", count=next_index - first_index)
+
         # Check if we've reached the end
         if next_index >= len(tasks):
             _log.debug("All tasks complete (including pre-skipped), finishing routine")
-            await self._complete_routine()
+            await self._complete_routine(now)
             return
         
         self._session.current_task_index = next_index
         self._session.task_elapsed_time = 0
+        self._set_current_task(tasks[next_index])
 
-        current_state = self._session.task_states[next_index]
-        current_state.status = TaskStatus.ACTIVE
-        current_state.started_at = datetime.now().isoformat()
+        current_state = self._session.set_task_status(next_index, TaskStatus.ACTIVE)
+        current_state.started_at = now
 
         next_task = tasks[next_index]
         _log.info(
@@ -706,55 +755,60 @@ class RoutineEngine:
         if self._notifications_enabled() and routine:
             settings = self._get_notification_settings(routine)
             if settings.notify_on_start:
-                await self.notifications.notify_task_started(
-                    task=next_task,
-                    routine_name=routine.name,
-                    task_index=next_index,
-                    total_tasks=len(tasks),
+                # Don't hold up the advance on TTS/push delivery
+                self.hass.async_create_task(
+                    self.notifications.notify_task_started(
+                        task=next_task,
+                        routine_name=routine.name,
+                        task_index=next_index,
+                        total_tasks=len(tasks),
+                    ),
+                    eager_start=True,
                 )
                 # Mark as sent
-                self._session.task_states[next_index].sent_start_notification = True
+                current_state.sent_start_notification = True
 
         if self._session.status == SessionStatus.RUNNING:
             self._start_timer()
 
         self._notify_update()
 
-    async def _complete_routine(self) -> None:
+    async def _complete_routine(self, now: float | None = None) -> None:
         """Complete the routine."""
         if not self._session:
             return
 
         self._session.status = SessionStatus.COMPLETED
-        self._session.completed_at = datetime.now().isoformat()
+        self._session.completed_at = _now_iso(now)
 
-        routine = self.storage.get_routine(self._session.routine_id)
+        routine = self._routine
         completed, skipped, total, _active_total = self.get_progress()
         elapsed_time = self._session.elapsed_time
         routine_id = self._session.routine_id
 
-        self._fire_event(
+        self.hass.bus.async_fire(
             EVENT_ROUTINE_COMPLETED,
             {
-                ATTR_ROUTINE_ID: routine_id,
-                ATTR_ROUTINE_NAME: routine.name if routine else "",
+                **self._routine_payload,
                 "tasks_completed": completed,
                 "tasks_skipped": skipped,
                 "total_duration": elapsed_time,
             },
         )
 
-        await self._save_to_history()
+        self._save_to_history()
 
         # Send completion notification and clear routine targets
         if self._notifications_enabled() and routine:
-            await self.notifications.notify_routine_completed(
-                routine=routine,
-                tasks_completed=completed,
-                tasks_skipped=skipped,
-                total_duration=elapsed_time,
+            await asyncio.gather(
+                self.notifications.notify_routine_completed(
+                    routine=routine,
+                    tasks_completed=completed,
+                    tasks_skipped=skipped,
+                    total_duration=elapsed_time,
+                ),
+                self.notifications.clear_notifications(),
             )
-            await self.notifications.clear_notifications()
             self.notifications.clear_active_routine_targets()
 
         _log.info(
@@ -765,15 +819,19 @@ class RoutineEngine:
             tasks_skipped=skipped,
             total_duration=elapsed_time,
         )
-        self._session = None
+        self._end_session()
         self._notify_update()
 
-    async def _save_to_history(self) -> None:
-        """Save current session to history."""
+    def _save_to_history(self) -> None:
+        """Save current session to history.
+
+        The record is built from the session immediately and added eagerly;
+        the storage write itself is delayed and coalesced by the storage layer.
+        """
         if not self._session:
             return
 
-        routine = self.storage.get_routine(self._session.routine_id)
+        routine = self._routine
         completed, skipped, total, _active_total = self.get_progress()
 
         history = SessionHistory(
@@ -782,199 +840,254 @@ class RoutineEngine:
             routine_name=routine.name if routine else "",
             status=self._session.status,
             started_at=self._session.started_at or "",
-            completed_at=self._session.completed_at or datetime.now().isoformat(),
+            completed_at=self._session.completed_at or _now_iso(),
             total_duration=self._session.elapsed_time,
             tasks_completed=completed,
             tasks_skipped=skipped,
             total_tasks=total,
         )
-        await self.storage.async_add_history(history)
+        task = self.hass.async_create_background_task(
+            self.storage.async_add_history(history),
+            "routinely_save_history",
+            eager_start=True,
+        )
+        task.add_done_callback(self._on_history_saved)
+
+    def _on_history_saved(self, task: asyncio.Task) -> None:
+        """Log a failed history write."""
+        if not task.cancelled() and (err := task.exception()):
+            _log.error("Failed to save session history", error=str(err))
+
+    def _start_timer(self, anchor: float | None = None) -> None:
+        """Schedule the deadlines for the current task or confirm window.
 
-    def _start_timer(self) -> None:
-        """Start the internal timer."""
-        if self._timer_task and not self._timer_task.done():
+        Instead of waking every second, each point where something has to
+        happen (notification thresholds, ending soon, expiry, confirm window
+        end) gets a single loop.call_at() handle. Elapsed time is counted from
+        the loop clock and folded into the session by _sync_elapsed().
+        """
+        if self._deadline_anchor is not None:
             _log.debug("Timer already running")
             return
 
-        _log.debug("Starting timer loop")
-        self._timer_task = self.hass.async_create_task(self._timer_loop())
-
-    def _stop_timer(self) -> None:
-        """Stop the internal timer."""
-        if self._timer_task and not self._timer_task.done():
-            _log.debug("Stopping timer loop")
-            self._timer_task.cancel()
-            self._timer_task = None
-
-    async def _timer_loop(self) -> None:
-        """Timer loop that ticks every second."""
-        _log.debug("Timer loop started")
-        try:
-            while self._session and self._session.status == SessionStatus.RUNNING:
-                await asyncio.sleep(1)
-
-                if not self._session or self._session.status != SessionStatus.RUNNING:
-                    _log.debug("Timer loop exiting: session ended or paused")
-                    break
-
-                self._session.elapsed_time += 1
-                self._session.task_elapsed_time += 1
-
-                task = self.get_current_task()
-                if not task:
-                    _log.warning("Timer loop: no current task found")
-                    break
-
-                if self._session.confirm_window_active:
-                    await self._handle_confirm_window_tick()
-                else:
-                    await self._handle_task_tick(task)
+        task = self.get_current_task()
+        if not self._session or not task:
+            _log.warning("Cannot start timer: no current task")
+            return
+
+        self._deadline_anchor = anchor if anchor is not None else self.hass.loop.time()
+        elapsed = self._session.task_elapsed_time
+
+        if self._session.confirm_window_active:
+            self._schedule(
+                elapsed + self._session.confirm_window_remaining,
+                self._expire_confirm_window,
+                task,
+            )
+            return
 
-                self._notify_update()
+        duration = task.duration
+        if self._notifications_enabled():
+            self._schedule_notifications(task, elapsed)
 
-        except asyncio.CancelledError:
-            _log.debug("Timer loop cancelled")
-        except Exception as e:
-            _log.exception("Timer loop error", error=str(e))
+        # Legacy ending soon event, which schedules the expiry once it fires.
+        # Expiry is only handled once per task.
+        ending_soon_at = duration - self._warning_time
+        if self._task_stage == _STAGE_RUNNING and ending_soon_at > elapsed:
+            self._schedule(ending_soon_at, self._fire_ending_soon, task)
+        elif self._task_stage != _STAGE_EXPIRED:
+            self._schedule(max(duration, elapsed + 1), self._expire_task, task)
 
-    async def _handle_task_tick(self, task: Task) -> None:
-        """Handle a timer tick during normal task execution."""
-        remaining = task.duration - self._session.task_elapsed_time
-        overdue = -remaining if remaining < 0 else 0
-        
-        # Get current task state
+        _log.debug("Task deadlines scheduled", task_id=task.id, handles=len(self._timer_handles))
+
+    def _schedule_notifications(self, task: Task, elapsed: int) -> None:
+        """Schedule the remaining/overdue/upcoming notification deadlines for a task."""
+        duration = task.duration
         current_state = self._session.task_states[self._session.current_task_index]
-        
-        # Get notification settings
-        routine = self.storage.get_routine(self._session.routine_id)
-        settings = self._get_notification_settings(routine)
-        
+        settings = self._get_notification_settings(self._routine)
+
         # Determine which timing lists to use based on task mode
         is_auto = task.advancement_mode == AdvancementMode.AUTO
         notify_before = settings.autonext_notify_before if is_auto else settings.notify_before
         notify_remaining = settings.autonext_notify_remaining if is_auto else settings.notify_remaining
-        notify_overdue = settings.notify_overdue
-
-        if self._notifications_enabled():
-            # Send "time remaining" notifications
-            for seconds in notify_remaining:
-                if remaining == seconds and seconds not in current_state.sent_remaining_notifications:
-                    current_state.sent_remaining_notifications.append(seconds)
-                    await self.notifications.notify_time_remaining(task, seconds)
-            
-            # Send "overdue" notifications (for manual/confirm mode tasks)
-            if overdue > 0 and not is_auto:
-                for seconds in notify_overdue:
-                    if overdue >= seconds and seconds not in current_state.sent_overdue_notifications:
-                        current_state.sent_overdue_notifications.append(seconds)
-                        await self.notifications.notify_task_overdue(task, seconds)
-            
-            # Check for upcoming task notifications (notify_before)
-            # This sends notifications about the NEXT task
-            next_task_index = self._session.current_task_index + 1
-            tasks = self._get_session_tasks()
-            
-            # Find next non-skipped task
-            while next_task_index < len(tasks):
-                next_state = self._session.task_states[next_task_index]
-                if next_state.status != TaskStatus.SKIPPED:
-                    break
-                next_task_index += 1
-            
-            if next_task_index < len(tasks) and remaining > 0:
-                next_task = tasks[next_task_index]
-                next_state = self._session.task_states[next_task_index]
-                
-                # Time until current task ends = remaining (this is when next task starts)
-                for seconds in notify_before:
-                    if remaining == seconds and seconds not in next_state.sent_before_notifications:
-                        next_state.sent_before_notifications.append(seconds)
-                        await self.notifications.notify_time_until_task(next_task, seconds)
-
-        # Legacy: Fire ending soon event  
-        warning_time = self.storage.get_setting(
-            "task_ending_warning", DEFAULT_TASK_ENDING_WARNING
-        )
-        if remaining == warning_time and not self._ending_soon_fired:
-            self._ending_soon_fired = True
-            self._fire_event(
-                EVENT_TASK_ENDING_SOON,
-                {
-                    ATTR_ROUTINE_ID: self._session.routine_id,
-                    ATTR_TASK_ID: task.id,
-                    ATTR_TASK_NAME: task.name,
-                    ATTR_TIME_REMAINING: remaining,
-                },
-            )
 
-        # Task timer expired - only handle once
-        if remaining <= 0 and not self._task_timer_expired:
-            self._task_timer_expired = True
-            await self._handle_task_timer_expired(task)
-
-    async def _handle_task_timer_expired(self, task: Task) -> None:
-        """Handle when task timer expires."""
-        match task.advancement_mode:
-            case AdvancementMode.AUTO:
-                await self._complete_current_task(auto_advanced=True)
-            case AdvancementMode.MANUAL:
-                self._fire_event(
-                    EVENT_TASK_AWAITING_INPUT,
-                    {
-                        ATTR_ROUTINE_ID: self._session.routine_id,
-                        ATTR_TASK_ID: task.id,
-                        ATTR_TASK_NAME: task.name,
-                        ATTR_ADVANCEMENT_MODE: task.advancement_mode.value,
-                    },
-                )
-                # Send awaiting input notification with TTS
-                if self._notifications_enabled():
-                    await self.notifications.notify_task_awaiting_input(
-                        task=task,
-                        is_confirm_mode=False,
+        # "Time remaining" notifications
+        for seconds in notify_remaining:
+            if duration - seconds > elapsed and seconds not in current_state.sent_remaining_notifications:
+                self._schedule(duration - seconds, self._send_time_remaining, task, seconds)
+
+        # "Overdue" notifications (manual mode; confirm tasks open a window instead)
+        if not is_auto:
+            for seconds in settings.notify_overdue:
+                if seconds not in current_state.sent_overdue_notifications:
+                    self._schedule(
+                        max(duration + max(seconds, 1), elapsed + 1),
+                        self._send_overdue,
+                        task,
+                        seconds,
                     )
-            case AdvancementMode.CONFIRM:
-                self._session.confirm_window_active = True
-                self._session.confirm_window_remaining = (
-                    task.confirm_window or DEFAULT_CONFIRM_WINDOW
-                )
-                self._fire_event(
-                    EVENT_TASK_AWAITING_INPUT,
-                    {
-                        ATTR_ROUTINE_ID: self._session.routine_id,
-                        ATTR_TASK_ID: task.id,
-                        ATTR_TASK_NAME: task.name,
-                        ATTR_ADVANCEMENT_MODE: task.advancement_mode.value,
-                    },
-                )
-                # Send awaiting input notification with TTS
-                if self._notifications_enabled():
-                    await self.notifications.notify_task_awaiting_input(
-                        task=task,
-                        is_confirm_mode=True,
-                        confirm_window=task.confirm_window or DEFAULT_CONFIRM_WINDOW,
+
+        # Upcoming task notifications (notify_before) about the next non-skipped task
+        next_index = self._session.next_unskipped(self._session.current_task_index + 1)
+        tasks = self._tasks
+        if next_index < len(tasks):
+            next_task = tasks[next_index]
+            next_state = self._session.task_states[next_index]
+            # Time until current task ends = remaining (this is when next task starts)
+            for seconds in notify_before:
+                if (
+                    seconds > 0
+                    and duration - seconds > elapsed
+                    and seconds not in next_state.sent_before_notifications
+                ):
+                    self._schedule(
+                        duration - seconds, self._send_time_until, next_task, next_state, seconds
                     )
 
-    async def _handle_confirm_window_tick(self) -> None:
-        """Handle a timer tick during confirm window."""
-        self._session.confirm_window_remaining -= 1
+    def _schedule(self, at_elapsed: int, action: Callable[..., None], *args: Any) -> None:
+        """Run action once the current task's elapsed time reaches at_elapsed."""
+        delay = at_elapsed - self._session.task_elapsed_time
+        self._timer_handles.append(
+            self.hass.loop.call_at(
+                self._deadline_anchor + delay, self._on_deadline, at_elapsed, action, args
+            )
+        )
 
-        if self._session.confirm_window_remaining <= 0:
-            self._session.confirm_window_active = False
-            await self._complete_current_task(auto_advanced=True)
+    def _on_deadline(self, at_elapsed: int, action: Callable[..., None], args: tuple) -> None:
+        """Bring elapsed time up to a deadline and run its action."""
+        if not self._session or self._session.status != SessionStatus.RUNNING:
+            return
+        self._sync_elapsed(at_elapsed)
+        action(*args)
+        self._notify_update()
+
+    def _stop_timer(self) -> float | None:
+        """Cancel pending deadlines and freeze elapsed time.
+
+        Returns the synced anchor, so a restart can keep the partial second.
+        """
+        if self._deadline_anchor is None:
+            return None
+        _log.debug("Stopping timer", handles=len(self._timer_handles))
+        for handle in self._timer_handles:
+            handle.cancel()
+        self._timer_handles.clear()
+        self._sync_elapsed()
+        anchor, self._deadline_anchor = self._deadline_anchor, None
+        return anchor
+
+    def _restart_timer(self) -> None:
+        """Reschedule deadlines after elapsed time or the confirm window changed."""
+        anchor = self._stop_timer()
+        if self._session and self._session.status == SessionStatus.RUNNING:
+            self._start_timer(anchor)
+
+    def _sync_elapsed(self, minimum: int | None = None) -> None:
+        """Fold whole seconds elapsed on the loop clock into the session.
+
+        Args:
+            minimum: Task elapsed time a firing deadline represents, so callbacks
+                     that run a hair early still see their exact second
+        """
+        if self._deadline_anchor is None or not self._session:
+            return
+        delta = int(self.hass.loop.time() - self._deadline_anchor)
+        if minimum is not None:
+            delta = max(delta, minimum - self._session.task_elapsed_time)
+        if delta > 0:
+            self._deadline_anchor += delta
+            self._session.elapsed_time += delta
+            self._session.task_elapsed_time += delta
+            if self._session.confirm_window_active:
+                self._session.confirm_window_remaining -= delta
+
+    def _send_time_remaining(self, task: Task, seconds: int) -> None:
+        """Send a "time remaining" notification for the current task."""
+        current_state = self._session.task_states[self._session.current_task_index]
+        current_state.sent_remaining_notifications.append(seconds)
+        self.hass.async_create_task(
+            self.notifications.notify_time_remaining(task, seconds), eager_start=True
+        )
+
+    def _send_overdue(self, task: Task, seconds: int) -> None:
+        """Send an "overdue" notification for the current task."""
+        current_state = self._session.task_states[self._session.current_task_index]
+        current_state.sent_overdue_notifications.append(seconds)
+        self.hass.async_create_task(
+            self.notifications.notify_task_overdue(task, seconds), eager_start=True
+        )
+
+    def _send_time_until(self, next_task: Task, next_state: TaskState, seconds: int) -> None:
+        """Send an upcoming task notification."""
+        next_state.sent_before_notifications.append(seconds)
+        self.hass.async_create_task(
+            self.notifications.notify_time_until_task(next_task, seconds), eager_start=True
+        )
+
+    def _fire_ending_soon(self, task: Task) -> None:
+        """Fire the ending soon event and schedule the task's expiry."""
+        self._task_stage = _STAGE_ENDING_SOON
+        self.hass.bus.async_fire(
+            EVENT_TASK_ENDING_SOON,
+            {**self._task_payload, ATTR_TIME_REMAINING: self._warning_time},
+        )
+        self._schedule(
+            max(task.duration, self._session.task_elapsed_time), self._expire_task, task
+        )
 
-    def _fire_event(self, event_type: str, data: dict) -> None:
-        """Fire a Home Assistant event."""
-        self.hass.bus.async_fire(event_type, data)
+    def _expire_task(self, task: Task) -> None:
+        """Handle the current task's timer reaching its duration."""
+        self._task_stage = _STAGE_EXPIRED
+        if task.advancement_mode == AdvancementMode.AUTO:
+            self.hass.async_create_task(
+                self._complete_current_task(auto_advanced=True, task=task),
+                eager_start=True,
+            )
+        else:
+            self._await_task_input(task)
+
+    def _expire_confirm_window(self, task: Task) -> None:
+        """Auto-advance when the confirm window runs out."""
+        self._session.confirm_window_active = False
+        self.hass.async_create_task(
+            self._complete_current_task(auto_advanced=True, task=task),
+            eager_start=True,
+        )
+
+    def _await_task_input(self, task: Task) -> None:
+        """Wait for the user on an expired manual or confirm task."""
+        is_confirm_mode = task.advancement_mode == AdvancementMode.CONFIRM
+        confirm_window: int | None = None
+        if is_confirm_mode:
+            confirm_window = task.confirm_window or DEFAULT_CONFIRM_WINDOW
+            self._session.confirm_window_active = True
+            self._session.confirm_window_remaining = confirm_window
+            self._restart_timer()
+
+        self.hass.bus.async_fire(
+            EVENT_TASK_AWAITING_INPUT,
+            {
+                **self._task_payload,
+                ATTR_ADVANCEMENT_MODE: task.advancement_mode.value,
+            },
+        )
+        # Send awaiting input notification with TTS
+        if self._notifications_enabled():
+            self.hass.async_create_task(
+                self.notifications.notify_task_awaiting_input(
+                    task=task,
+                    is_confirm_mode=is_confirm_mode,
+                    confirm_window=confirm_window,
+                ),
+                eager_start=True,
+            )
 
     def _fire_task_started_event(self, task: Task, index: int) -> None:
         """Fire task started event."""
-        self._fire_event(
+        self.hass.bus.async_fire(
             EVENT_TASK_STARTED,
             {
-                ATTR_ROUTINE_ID: self._session.routine_id,
-                ATTR_TASK_ID: task.id,
-                ATTR_TASK_NAME: task.name,
+                **self._task_payload,
                 ATTR_CURRENT_TASK_INDEX: index,
                 ATTR_DURATION: task.duration,
                 ATTR_ADVANCEMENT_MODE: task.advancement_mode.value,
@@ -982,6 +1095,16 @@ class RoutineEngine:
         )
 
     def _notify_update(self) -> None:
-        """Notify coordinator of state change."""
-        if self._update_callback:
-            self._update_callback()
+        """Notify coordinator of state change.
+
+        Calls made in the same loop iteration (e.g. a deadline completing a
+        task and starting the next one) are coalesced into one update.
+        """
+        if self._update_callback and not self._update_pending:
+            self._update_pending = True
+            self.hass.loop.call_soon(self._flush_update)
+
+    def _flush_update(self) -> None:
+        """Deliver a coalesced state update to the coordinator."""
+        self._update_pending = False
+        self._update_callback()
@@ -0,0 +1,44 @@
+"""Duration formatting helpers for the Routinely integration."""
+from __future__ import annotations
+
+from functools import lru_cache
+
+
+@lru_cache(maxsize=512)
+def format_duration(seconds: int) -> str:
+    """Format seconds as human-readable duration (e.g. "2m 5s")."""
+    if seconds < 60:
+        return f"{seconds}s"
+    minutes, secs = divmod(seconds, 60)
+    if secs == 0:
+        return f"{minutes}m"
+    return f"{minutes}m {secs}s"
+
+
+@lru_cache(maxsize=512)
+def format_duration_hms(seconds: int) -> str:
+    """Format seconds rounded down to minutes, rolling up to hours (e.g. "1h 5m")."""
+    if seconds < 60:
+        return f"{seconds}s"
+    minutes = seconds // 60
+    if minutes < 60:
+        return f"{minutes}m"
+    hours, mins = divmod(minutes, 60)
+    if mins == 0:
+        return f"{hours}h"
+    return f"{hours}h {mins}m"
+
+
+@lru_cache(maxsize=512)
+def format_duration_spoken(seconds: int) -> str:
+    """Format duration for TTS (spoken)."""
+    if seconds < 60:
+        return f"{seconds} seconds"
+    minutes, secs = divmod(seconds, 60)
+    if minutes == 1:
+        result = "1 minute"
+    else:
+        result = f"{minutes} minutes"
+    if secs > 0:
+        result += f" {secs} seconds"
+    return result
@@ -11,7 +11,7 @@ Home Assistant uses Python's standard logging module. Log levels can be controll
    ```
 
 Log Levels:
-- DEBUG: Detailed diagnostic information (timer ticks, state changes)
+- DEBUG: Detailed diagnostic information (timer deadlines, state changes)
 - INFO: Routine/task lifecycle events, service calls
 - WARNING: Recoverable issues, deprecated usage
 - ERROR: Failures that prevent operations
@@ -19,6 +19,7 @@ Log Levels:
 """
 from __future__ import annotations
 
+import asyncio
 import logging
 from enum import IntEnum
 from functools import wraps
@@ -46,17 +47,19 @@ class LogLevel(IntEnum):
     @classmethod
     def from_string(cls, level: str) -> "LogLevel":
         """Convert string to LogLevel."""
-        level_map = {
-            "debug": cls.DEBUG,
-            "verbose": cls.DEBUG,  # Map verbose to debug
-            "info": cls.INFO,
-            "log": cls.INFO,  # Map generic 'log' to info
-            "warning": cls.WARNING,
-            "warn": cls.WARNING,
-            "error": cls.ERROR,
-            "critical": cls.CRITICAL,
-        }
-        return level_map.get(level.lower(), cls.INFO)
+        return _LEVEL_NAME_MAP.get(level.lower(), cls.INFO)
+
+
+_LEVEL_NAME_MAP = {
+    "debug": LogLevel.DEBUG,
+    "verbose": LogLevel.DEBUG,  # Map verbose to debug
+    "info": LogLevel.INFO,
+    "log": LogLevel.INFO,  # Map generic 'log' to info
+    "warning": LogLevel.WARNING,
+    "warn": LogLevel.WARNING,
+    "error": LogLevel.ERROR,
+    "critical": LogLevel.CRITICAL,
+}
 
 
 def get_logger(name: str | None = None) -> logging.Logger:
@@ -109,7 +112,7 @@ class RoutinelyLogger:
     
     Usage:
         logger = RoutinelyLogger("engine")
-        logger.debug("Timer tick", task_id="abc123", remaining=45)
+        logger.debug("Deadline reached", task_id="abc123", remaining=45)
         logger.info("Routine started", routine_id="morning", tasks=5)
     """
 
@@ -130,37 +133,46 @@ class RoutinelyLogger:
         """Clear all context."""
         self._context.clear()
 
-    def _format_message(self, message: str, **kwargs: Any) -> str:
+    def _format_message(self, message: str, /, **kwargs: Any) -> str:
         """Format message with context and additional kwargs."""
-        all_context = {**self._context, **kwargs}
-        if all_context:
-            context_str = " | ".join(f"{k}={v}" for k, v in all_context.items())
-            return f"{message} [{context_str}]"
-        return message
-
-    def debug(self, message: str, **kwargs: Any) -> None:
+        if kwargs:
+            all_context = {**self._context, **kwargs} if self._context else kwargs
+        elif self._context:
+            all_context = self._context
+        else:
+            return message
+        context_str = " | ".join(f"{k}={v}" for k, v in all_context.items())
+        return f"{message} [{context_str}]"
+
+    def debug(self, message: str, /, **kwargs: Any) -> None:
         """Log debug message with optional context."""
-        self._logger.debug(self._format_message(message, **kwargs))
+        if self._logger.isEnabledFor(logging.DEBUG):
+            self._logger.debug(self._format_message(message, **kwargs))
 
-    def info(self, message: str, **kwargs: Any) -> None:
+    def info(self, message: str, /, **kwargs: Any) -> None:
         """Log info message with optional context."""
-        self._logger.info(self._format_message(message, **kwargs))
+        if self._logger.isEnabledFor(logging.INFO):
+            self._logger.info(self._format_message(message, **kwargs))
 
-    def warning(self, message: str, **kwargs: Any) -> None:
+    def warning(self, message: str, /, **kwargs: Any) -> None:
         """Log warning message with optional context."""
-        self._logger.warning(self._format_message(message, **kwargs))
+        if self._logger.isEnabledFor(logging.WARNING):
+            self._logger.warning(self._format_message(message, **kwargs))
 
-    def error(self, message: str, **kwargs: Any) -> None:
+    def error(self, message: str, /, **kwargs: Any) -> None:
         """Log error message with optional context."""
-        self._logger.error(self._format_message(message, **kwargs))
+        if self._logger.isEnabledFor(logging.ERROR):
+            self._logger.error(self._format_message(message, **kwargs))
 
-    def critical(self, message: str, **kwargs: Any) -> None:
+    def critical(self, message: str, /, **kwargs: Any) -> None:
         """Log critical message with optional context."""
-        self._logger.critical(self._format_message(message, **kwargs))
+        if self._logger.isEnabledFor(logging.CRITICAL):
+            self._logger.critical(self._format_message(message, **kwargs))
 
-    def exception(self, message: str, **kwargs: Any) -> None:
+    def exception(self, message: str, /, **kwargs: Any) -> None:
         """Log exception with traceback."""
-        self._logger.exception(self._format_message(message, **kwargs))
+        if self._logger.isEnabledFor(logging.ERROR):
+            self._logger.exception(self._format_message(message, **kwargs))
 
 
 def log_call(level: str = "debug") -> Callable:
@@ -174,10 +186,13 @@ def log_call(level: str = "debug") -> Callable:
     def decorator(func: Callable) -> Callable:
         logger = get_logger(func.__module__.split(".")[-1])
         log_func = getattr(logger, level, logger.debug)
+        level_no = getattr(logging, level.upper(), logging.DEBUG)
+        func_name = func.__qualname__
 
         @wraps(func)
         async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
-            func_name = func.__qualname__
+            if not logger.isEnabledFor(level_no):
+                return await func(*args, **kwargs)
             log_func("CALL %s(args=%s, kwargs=%s)", func_name, args[1:], kwargs)
             try:
                 result = await func(*args, **kwargs)
@@ -189,7 +204,8 @@ def log_call(level: str = "debug") -> Callable:
 
         @wraps(func)
         def sync_wrapper(*args: Any, **kwargs: Any) -> Any:
-            func_name = func.__qualname__
+            if not logger.isEnabledFor(level_no):
+                return func(*args, **kwargs)
             log_func("CALL %s(args=%s, kwargs=%s)", func_name, args[1:], kwargs)
             try:
                 result = func(*args, **kwargs)
@@ -199,19 +215,13 @@ def log_call(level: str = "debug") -> Callable:
                 logger.error("EXCEPTION %s: %s", func_name, e)
                 raise
 
-        if asyncio_iscoroutinefunction(func):
+        if asyncio.iscoroutinefunction(func):
             return async_wrapper
         return sync_wrapper
 
     return decorator
 
 
-def asyncio_iscoroutinefunction(func: Callable) -> bool:
-    """Check if function is a coroutine function."""
-    import asyncio
-    return asyncio.iscoroutinefunction(func)
-
-
 # Pre-configured loggers for each module
 class Loggers:
     """Pre-configured loggers for each module."""
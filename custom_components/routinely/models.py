@@ -1,20 +1,71 @@
 """Data models for the Routinely integration."""
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+from array import array
+from collections.abc import Sequence
+from dataclasses import dataclass, field, fields
 from datetime import datetime
+from secrets import token_hex
 from typing import Any
-import uuid
 
-from .const import AdvancementMode, SessionStatus, TaskStatus
+from .const import (
+    DEFAULT_AUTONEXT_NOTIFY_BEFORE,
+    DEFAULT_AUTONEXT_NOTIFY_REMAINING,
+    DEFAULT_NOTIFY_BEFORE,
+    DEFAULT_NOTIFY_OVERDUE,
+    DEFAULT_NOTIFY_REMAINING,
+    AdvancementMode,
+    SessionStatus,
+    TaskStatus,
+)
+
+# Compact codes for TaskStatus, used by the session's status array
+TASK_STATUS_CODES: dict[TaskStatus, int] = {
+    status: code for code, status in enumerate(TaskStatus)
+}
+
+# Persisted value -> enum member, to skip Enum.__call__ when loading. Unknown
+# values fall back to the constructor so they still raise ValueError.
+_ADVANCEMENT_MODES = {m.value: m for m in AdvancementMode}
+_TASK_STATUSES = {m.value: m for m in TaskStatus}
+_SESSION_STATUSES = {m.value: m for m in SessionStatus}
+# Enum member -> plain value for to_dict, without going through the .value property
+_ENUM_VALUES: dict[Any, str] = {
+    m: m.value for enum_cls in (AdvancementMode, TaskStatus, SessionStatus) for m in enum_cls
+}
+
+
+def _member(members: dict[str, Any], enum_cls: type, value: str) -> Any:
+    """Resolve a persisted enum value through its lookup table."""
+    return members.get(value) or enum_cls(value)
+
+
+def _iso(timestamp: float | None) -> str | None:
+    """Format an epoch timestamp as ISO 8601 for persistence."""
+    return datetime.fromtimestamp(timestamp).isoformat() if timestamp is not None else None
+
+
+def _timestamp(value: str | float | None) -> float | None:
+    """Parse a persisted ISO 8601 string (or epoch value) to an epoch timestamp."""
+    if value is None or isinstance(value, (int, float)):
+        return value
+    return datetime.fromisoformat(value).timestamp()
+
+
+_now = datetime.now
+
+
+def now_iso() -> str:
+    """Return the current local time as an ISO 8601 string."""
+    return _now().isoformat()
 
 
 def generate_id() -> str:
     """Generate a unique ID."""
-    return uuid.uuid4().hex[:12]
+    return token_hex(6)
 
 
-@dataclass
+@dataclass(slots=True)
 class Task:
     """Represents a single task."""
 
@@ -32,7 +83,9 @@ class Task:
 
     def __post_init__(self) -> None:
         """Set timestamps if not provided."""
-        now = datetime.now().isoformat()
+        if self.created_at and self.updated_at:
+            return
+        now = now_iso()
         if not self.created_at:
             self.created_at = now
         if not self.updated_at:
@@ -41,19 +94,13 @@ class Task:
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> Task:
         """Create Task from dictionary."""
-        return cls(
-            id=data["id"],
-            name=data["name"],
-            duration=data["duration"],
-            icon=data.get("icon", "mdi:checkbox-marked-circle-outline"),
-            advancement_mode=AdvancementMode(data.get("advancement_mode", "auto")),
-            confirm_window=data.get("confirm_window"),
-            description=data.get("description"),
-            notification_message=data.get("notification_message"),
-            tts_message=data.get("tts_message"),
-            created_at=data.get("created_at", ""),
-            updated_at=data.get("updated_at", ""),
-        )
+        # Keys missing from data fall back to the field defaults
+        kwargs = {k: data[k] for k in _TASK_FIELDS if k in data}
+        if "advancement_mode" in kwargs:
+            kwargs["advancement_mode"] = _member(
+                _ADVANCEMENT_MODES, AdvancementMode, kwargs["advancement_mode"]
+            )
+        return cls(**kwargs)
 
     def to_dict(self) -> dict[str, Any]:
         """Convert Task to dictionary."""
@@ -62,7 +109,7 @@ class Task:
             "name": self.name,
             "duration": self.duration,
             "icon": self.icon,
-            "advancement_mode": self.advancement_mode.value,
+            "advancement_mode": _ENUM_VALUES[self.advancement_mode],
             "confirm_window": self.confirm_window,
             "description": self.description,
             "notification_message": self.notification_message,
@@ -72,38 +119,43 @@ class Task:
         }
 
 
-@dataclass
+# Keys Task.from_dict copies from persisted data
+_TASK_FIELDS = tuple(f.name for f in fields(Task))
+
+
+@dataclass(slots=True)
 class NotificationSettings:
     """Notification timing settings."""
     
     # Notifications before task starts (seconds)
-    notify_before: list[int] = field(default_factory=lambda: [600, 300, 60])
+    notify_before: Sequence[int] = DEFAULT_NOTIFY_BEFORE
     # Notify when task starts
     notify_on_start: bool = True
     # Notifications for time remaining (seconds)
-    notify_remaining: list[int] = field(default_factory=lambda: [300, 60])
+    notify_remaining: Sequence[int] = DEFAULT_NOTIFY_REMAINING
     # Notifications when overdue (seconds)
-    notify_overdue: list[int] = field(default_factory=lambda: [60, 300, 600])
+    notify_overdue: Sequence[int] = DEFAULT_NOTIFY_OVERDUE
     # Notify when task completes
     notify_on_complete: bool = False
     # Auto-next specific (different timing for auto-advancing tasks)
-    autonext_notify_before: list[int] = field(default_factory=lambda: [300, 60])
-    autonext_notify_remaining: list[int] = field(default_factory=lambda: [60])
+    autonext_notify_before: Sequence[int] = DEFAULT_AUTONEXT_NOTIFY_BEFORE
+    autonext_notify_remaining: Sequence[int] = DEFAULT_AUTONEXT_NOTIFY_REMAINING
     # Per-routine notification targets (None = use global targets)
     notification_targets: str | None = None  # Comma-separated targets
     
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "NotificationSettings":
         """Create NotificationSettings from dictionary."""
+        get = data.get
         return cls(
-            notify_before=data.get("notify_before", [600, 300, 60]),
-            notify_on_start=data.get("notify_on_start", True),
-            notify_remaining=data.get("notify_remaining", [300, 60]),
-            notify_overdue=data.get("notify_overdue", [60, 300, 600]),
-            notify_on_complete=data.get("notify_on_complete", False),
-            autonext_notify_before=data.get("autonext_notify_before", [300, 60]),
-            autonext_notify_remaining=data.get("autonext_notify_remaining", [60]),
-            notification_targets=data.get("notification_targets"),
+            notify_before=get("notify_before", DEFAULT_NOTIFY_BEFORE),
+            notify_on_start=get("notify_on_start", True),
+            notify_remaining=get("notify_remaining", DEFAULT_NOTIFY_REMAINING),
+            notify_overdue=get("notify_overdue", DEFAULT_NOTIFY_OVERDUE),
+            notify_on_complete=get("notify_on_complete", False),
+            autonext_notify_before=get("autonext_notify_before", DEFAULT_AUTONEXT_NOTIFY_BEFORE),
+            autonext_notify_remaining=get("autonext_notify_remaining", DEFAULT_AUTONEXT_NOTIFY_REMAINING),
+            notification_targets=get("notification_targets"),
         )
     
     def to_dict(self) -> dict[str, Any]:
@@ -120,7 +172,7 @@ class NotificationSettings:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class Routine:
     """Represents a routine (ordered collection of tasks)."""
 
@@ -128,10 +180,10 @@ class Routine:
     name: str
     icon: str = "mdi:playlist-check"
     task_ids: list[str] = field(default_factory=list)
-    tags: list[str] = field(default_factory=list)
+    tags: Sequence[str] = ()
     # Schedule fields (for UI display, actual scheduling via HA automations)
     schedule_time: str | None = None  # e.g., "08:00"
-    schedule_days: list[str] = field(default_factory=list)  # e.g., ["mon", "tue", "wed"]
+    schedule_days: Sequence[str] = ()  # e.g., ["mon", "tue", "wed"]
     # Notification settings override (None = use global defaults)
     notification_settings: NotificationSettings | None = None
     created_at: str = ""
@@ -139,7 +191,9 @@ class Routine:
 
     def __post_init__(self) -> None:
         """Set timestamps if not provided."""
-        now = datetime.now().isoformat()
+        if self.created_at and self.updated_at:
+            return
+        now = now_iso()
         if not self.created_at:
             self.created_at = now
         if not self.updated_at:
@@ -148,23 +202,17 @@ class Routine:
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> Routine:
         """Create Routine from dictionary."""
-        notif_data = data.get("notification_settings")
-        notif_settings = NotificationSettings.from_dict(notif_data) if notif_data else None
-        return cls(
-            id=data["id"],
-            name=data["name"],
-            icon=data.get("icon", "mdi:playlist-check"),
-            task_ids=data.get("task_ids", []),
-            tags=data.get("tags", []),
-            schedule_time=data.get("schedule_time"),
-            schedule_days=data.get("schedule_days", []),
-            notification_settings=notif_settings,
-            created_at=data.get("created_at", ""),
-            updated_at=data.get("updated_at", ""),
-        )
+        # Keys missing from data fall back to the field defaults
+        kwargs = {k: data[k] for k in _ROUTINE_FIELDS if k in data}
+        if notif_data := kwargs.get("notification_settings"):
+            kwargs["notification_settings"] = NotificationSettings.from_dict(notif_data)
+        else:
+            kwargs["notification_settings"] = None
+        return cls(**kwargs)
 
     def to_dict(self) -> dict[str, Any]:
         """Convert Routine to dictionary."""
+        ns = self.notification_settings
         return {
             "id": self.id,
             "name": self.name,
@@ -173,21 +221,26 @@ class Routine:
             "tags": self.tags,
             "schedule_time": self.schedule_time,
             "schedule_days": self.schedule_days,
-            "notification_settings": self.notification_settings.to_dict() if self.notification_settings else None,
+            "notification_settings": ns.to_dict() if ns else None,
             "created_at": self.created_at,
             "updated_at": self.updated_at,
         }
 
 
-@dataclass
+# Keys Routine.from_dict copies from persisted data
+_ROUTINE_FIELDS = tuple(f.name for f in fields(Routine))
+
+
+@dataclass(slots=True, eq=False)
 class TaskState:
     """State of a task within an execution session."""
 
     task_id: str
     status: TaskStatus = TaskStatus.PENDING
-    started_at: str | None = None
-    completed_at: str | None = None
-    skipped_at: str | None = None
+    # Epoch seconds; formatted as ISO strings only when serialized
+    started_at: float | None = None
+    completed_at: float | None = None
+    skipped_at: float | None = None
     actual_duration: int | None = None
     was_auto_advanced: bool = False
     # Track which notifications have been sent (seconds values)
@@ -200,29 +253,30 @@ class TaskState:
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "TaskState":
         """Create TaskState from dictionary."""
+        get = data.get
         return cls(
             task_id=data["task_id"],
-            status=TaskStatus(data.get("status", "pending")),
-            started_at=data.get("started_at"),
-            completed_at=data.get("completed_at"),
-            skipped_at=data.get("skipped_at"),
-            actual_duration=data.get("actual_duration"),
-            was_auto_advanced=data.get("was_auto_advanced", False),
-            sent_before_notifications=data.get("sent_before_notifications", []),
-            sent_remaining_notifications=data.get("sent_remaining_notifications", []),
-            sent_overdue_notifications=data.get("sent_overdue_notifications", []),
-            sent_start_notification=data.get("sent_start_notification", False),
-            sent_complete_notification=data.get("sent_complete_notification", False),
+            status=_member(_TASK_STATUSES, TaskStatus, get("status", "pending")),
+            started_at=_timestamp(get("started_at")),
+            completed_at=_timestamp(get("completed_at")),
+            skipped_at=_timestamp(get("skipped_at")),
+            actual_duration=get("actual_duration"),
+            was_auto_advanced=get("was_auto_advanced", False),
+            sent_before_notifications=get("sent_before_notifications", []),
+            sent_remaining_notifications=get("sent_remaining_notifications", []),
+            sent_overdue_notifications=get("sent_overdue_notifications", []),
+            sent_start_notification=get("sent_start_notification", False),
+            sent_complete_notification=get("sent_complete_notification", False),
         )
 
     def to_dict(self) -> dict[str, Any]:
         """Convert TaskState to dictionary."""
         return {
             "task_id": self.task_id,
-            "status": self.status.value,
-            "started_at": self.started_at,
-            "completed_at": self.completed_at,
-            "skipped_at": self.skipped_at,
+            "status": _ENUM_VALUES[self.status],
+            "started_at": _iso(self.started_at),
+            "completed_at": _iso(self.completed_at),
+            "skipped_at": _iso(self.skipped_at),
             "actual_duration": self.actual_duration,
             "was_auto_advanced": self.was_auto_advanced,
             "sent_before_notifications": self.sent_before_notifications,
@@ -233,7 +287,7 @@ class TaskState:
         }
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class ExecutionSession:
     """Represents an active or completed routine execution session."""
 
@@ -250,25 +304,69 @@ class ExecutionSession:
     task_elapsed_time: int = 0
     confirm_window_active: bool = False
     confirm_window_remaining: int = 0
+    # Status codes mirroring task_states (structure-of-arrays), not persisted
+    status_codes: array = field(init=False, repr=False)
+    # Live number of tasks per status code, not persisted
+    status_counts: list[int] = field(init=False, repr=False)
+    # Number of tasks before each index that weren't skipped in review
+    # (one extra slot holds the total), not persisted
+    active_before: array = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        """Build the status code arrays and counters from the task states."""
+        self.status_codes = array(
+            "B", [TASK_STATUS_CODES[ts.status] for ts in self.task_states]
+        )
+        self.status_counts = [self.status_codes.count(code) for code in range(len(TaskStatus))]
+        # Pre-skipped tasks have status SKIPPED but no started_at time
+        self.active_before = array("I", [0])
+        active = 0
+        for ts in self.task_states:
+            if ts.status != TaskStatus.SKIPPED or ts.started_at is not None:
+                active += 1
+            self.active_before.append(active)
+
+    def set_task_status(self, index: int, status: TaskStatus) -> TaskState:
+        """Set a task's status, keeping the status codes and counters in sync."""
+        state = self.task_states[index]
+        state.status = status
+        code = TASK_STATUS_CODES[status]
+        self.status_counts[self.status_codes[index]] -= 1
+        self.status_counts[code] += 1
+        self.status_codes[index] = code
+        return state
+
+    def count_status(self, status: TaskStatus) -> int:
+        """Count tasks with the given status."""
+        return self.status_counts[TASK_STATUS_CODES[status]]
+
+    def next_unskipped(self, index: int) -> int:
+        """Return the first index from index on that isn't skipped, or the task count."""
+        codes = self.status_codes
+        skipped = TASK_STATUS_CODES[TaskStatus.SKIPPED]
+        while index < len(codes) and codes[index] == skipped:
+            index += 1
+        return index
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> ExecutionSession:
         """Create ExecutionSession from dictionary."""
-        task_states = [TaskState.from_dict(ts) for ts in data.get("task_states", [])]
+        get = data.get
+        task_states = list(map(TaskState.from_dict, get("task_states", ())))
         return cls(
             id=data["id"],
             routine_id=data["routine_id"],
-            status=SessionStatus(data.get("status", "idle")),
-            current_task_index=data.get("current_task_index", 0),
+            status=_member(_SESSION_STATUSES, SessionStatus, get("status", "idle")),
+            current_task_index=get("current_task_index", 0),
             task_states=task_states,
-            task_ids=data.get("task_ids", []),
-            started_at=data.get("started_at"),
-            paused_at=data.get("paused_at"),
-            completed_at=data.get("completed_at"),
-            elapsed_time=data.get("elapsed_time", 0),
-            task_elapsed_time=data.get("task_elapsed_time", 0),
-            confirm_window_active=data.get("confirm_window_active", False),
-            confirm_window_remaining=data.get("confirm_window_remaining", 0),
+            task_ids=get("task_ids", []),
+            started_at=get("started_at"),
+            paused_at=get("paused_at"),
+            completed_at=get("completed_at"),
+            elapsed_time=get("elapsed_time", 0),
+            task_elapsed_time=get("task_elapsed_time", 0),
+            confirm_window_active=get("confirm_window_active", False),
+            confirm_window_remaining=get("confirm_window_remaining", 0),
         )
 
     def to_dict(self) -> dict[str, Any]:
@@ -276,9 +374,9 @@ class ExecutionSession:
         return {
             "id": self.id,
             "routine_id": self.routine_id,
-            "status": self.status.value,
+            "status": _ENUM_VALUES[self.status],
             "current_task_index": self.current_task_index,
-            "task_states": [ts.to_dict() for ts in self.task_states],
+            "task_states": list(map(TaskState.to_dict, self.task_states)),
             "task_ids": self.task_ids,
             "started_at": self.started_at,
             "paused_at": self.paused_at,
@@ -290,7 +388,7 @@ class ExecutionSession:
         }
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class SessionHistory:
     """Completed session record for history."""
 
@@ -308,17 +406,18 @@ class SessionHistory:
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> SessionHistory:
         """Create SessionHistory from dictionary."""
+        item = data.__getitem__
         return cls(
-            id=data["id"],
-            routine_id=data["routine_id"],
-            routine_name=data["routine_name"],
-            status=SessionStatus(data["status"]),
-            started_at=data["started_at"],
-            completed_at=data["completed_at"],
-            total_duration=data["total_duration"],
-            tasks_completed=data["tasks_completed"],
-            tasks_skipped=data["tasks_skipped"],
-            total_tasks=data["total_tasks"],
+            id=item("id"),
+            routine_id=item("routine_id"),
+            routine_name=item("routine_name"),
+            status=_member(_SESSION_STATUSES, SessionStatus, item("status")),
+            started_at=item("started_at"),
+            completed_at=item("completed_at"),
+            total_duration=item("total_duration"),
+            tasks_completed=item("tasks_completed"),
+            tasks_skipped=item("tasks_skipped"),
+            total_tasks=item("total_tasks"),
         )
 
     def to_dict(self) -> dict[str, Any]:
@@ -327,7 +426,7 @@ class SessionHistory:
             "id": self.id,
             "routine_id": self.routine_id,
             "routine_name": self.routine_name,
-            "status": self.status.value,
+            "status": _ENUM_VALUES[self.status],
             "started_at": self.started_at,
             "completed_at": self.completed_at,
             "total_duration": self.total_duration,
@@ -1,19 +1,29 @@
 """Notification handler for the Routinely integration."""
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any
+import asyncio
+import json
+import re
+from collections.abc import Sequence
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Callable, NamedTuple
 
 from homeassistant.components.notify import ATTR_DATA, ATTR_MESSAGE, ATTR_TITLE
+from homeassistant.const import ATTR_DOMAIN, EVENT_SERVICE_REGISTERED, EVENT_SERVICE_REMOVED
+from homeassistant.core import Event, callback
 
 from .const import (
     CONF_ENABLE_BROWSER_MOD_TTS,
     CONF_ENABLE_HA_PERSISTENT,
     CONF_ENABLE_TTS,
+    CONF_NOTIFICATION_BATCH_WINDOW,
     CONF_NOTIFICATION_TARGETS,
     CONF_TTS_ENTITY,
+    DEFAULT_NOTIFICATION_BATCH_WINDOW,
     DOMAIN,
     NotificationAction,
 )
+from .formatting import format_duration, format_duration_spoken
 from .logger import Loggers
 
 if TYPE_CHECKING:
@@ -38,6 +48,165 @@ DEFAULT_MESSAGES = {
 }
 
 
+# Bound str.format of each default message, keyed like DEFAULT_MESSAGES
+_FORMATTERS: dict[str, Callable[..., str]] = {
+    key: template.format for key, template in DEFAULT_MESSAGES.items()
+}
+
+
+class _TaskNotification(NamedTuple):
+    """How a simple task notification is worded and delivered."""
+
+    title: Callable[..., str]
+    message: Callable[..., str]
+    actions: tuple[NotificationAction, ...] | None
+    critical: bool
+
+
+# Task notifications that differ only in wording; the TTS text is the message
+_TASK_NOTIFICATIONS: dict[str, _TaskNotification] = {
+    "task_ending": _TaskNotification(
+        "⚠️ {task_name}".format,
+        _FORMATTERS["task_ending_soon"],
+        (NotificationAction.SKIP, NotificationAction.COMPLETE),
+        critical=True,
+    ),
+    "task_upcoming": _TaskNotification(
+        "⏰ {task_name}".format,
+        "{time_str} until {task_name}".format,
+        (NotificationAction.PAUSE,),
+        critical=False,
+    ),
+    "task_remaining": _TaskNotification(
+        "⏱️ {task_name}".format,
+        "{time_str} remaining in {task_name}".format,
+        (NotificationAction.COMPLETE, NotificationAction.SKIP),
+        critical=False,
+    ),
+    "task_overdue": _TaskNotification(
+        "⚠️ {task_name} Overdue".format,
+        "{time_str} over on {task_name}".format,
+        (NotificationAction.COMPLETE, NotificationAction.SKIP),
+        critical=True,
+    ),
+    "task_completed": _TaskNotification(
+        "✅ {task_name}".format,
+        "{task_name} completed".format,
+        None,
+        critical=False,
+    ),
+}
+
+# Device name hints used to guess a mobile_app target's platform
+_ANDROID_RE = re.compile("android|pixel|galaxy", re.IGNORECASE)
+_IOS_RE = re.compile("iphone|ipad|ios", re.IGNORECASE)
+
+# JavaScript run by browser_mod to speak using the Web Speech API.
+# This works on iOS Safari, Chrome, Firefox, Edge, etc.
+_BROWSER_MOD_TTS_JS = """
+    if ('speechSynthesis' in window) {
+        const utterance = new SpeechSynthesisUtterance({message});
+        utterance.rate = 1.0;
+        utterance.pitch = 1.0;
+        utterance.volume = 1.0;
+        speechSynthesis.speak(utterance);
+    }
+"""
+
+# iOS push payloads, shared by every notification (never mutated).
+# Plain dicts rather than MappingProxyType so they stay JSON-serializable.
+_PUSH_CRITICAL: dict[str, Any] = {
+    # Critical alert: bypasses DND, plays sound even when muted
+    "sound": {
+        "name": "default",
+        "critical": 1,
+        "volume": 1.0,  # Maximum volume
+    },
+    # Critical interruption level - highest priority on iOS
+    # Breaks through all DND/Focus modes
+    "interruption-level": "critical",
+}
+_PUSH_NORMAL: dict[str, Any] = {
+    "sound": {
+        "name": "default",
+        "critical": 0,
+        "volume": 0.8,
+    },
+    # time-sensitive: May break through some Focus modes
+    # active: Normal notification
+    "interruption-level": "time-sensitive",
+}
+_APNS_HEADERS: dict[str, str] = {
+    "apns-push-type": "alert",
+}
+
+# Action button titles and iOS SF Symbols icons
+_ACTION_TITLES: dict[NotificationAction, str] = {
+    NotificationAction.PAUSE: "Pause",
+    NotificationAction.RESUME: "Resume",
+    NotificationAction.SKIP: "Skip",
+    NotificationAction.COMPLETE: "Done",
+    NotificationAction.CONFIRM: "Continue",
+    NotificationAction.SNOOZE: "+30s",
+    NotificationAction.CANCEL: "Cancel",
+}
+_ACTION_ICONS: dict[NotificationAction, str] = {
+    NotificationAction.PAUSE: "sfsymbols:pause.fill",
+    NotificationAction.RESUME: "sfsymbols:play.fill",
+    NotificationAction.SKIP: "sfsymbols:forward.fill",
+    NotificationAction.COMPLETE: "sfsymbols:checkmark.circle.fill",
+    NotificationAction.CONFIRM: "sfsymbols:arrow.right.circle.fill",
+    NotificationAction.SNOOZE: "sfsymbols:clock.badge.plus",
+    NotificationAction.CANCEL: "sfsymbols:xmark.circle.fill",
+}
+
+
+def _action_payload(action: NotificationAction) -> dict[str, Any]:
+    """Build the notification button data for an action."""
+    action_data: dict[str, Any] = {
+        "action": action.value,
+        "title": _ACTION_TITLES.get(action, action.value),
+    }
+    # iOS SF Symbols icon
+    icon = _ACTION_ICONS.get(action, "")
+    if icon:
+        action_data["icon"] = icon
+    # Destructive actions show in red on iOS
+    if action in (NotificationAction.CANCEL, NotificationAction.SKIP):
+        action_data["destructive"] = True
+    # Auth required actions need device unlock
+    if action in (NotificationAction.CANCEL,):
+        action_data["authenticationRequired"] = True
+    return action_data
+
+
+# Button data is fixed per action, so build it once (never mutated)
+_ACTION_PAYLOADS: dict[NotificationAction, dict[str, Any]] = {
+    action: _action_payload(action) for action in NotificationAction
+}
+
+
+@lru_cache(maxsize=16)
+def _split_targets(targets: str) -> list[str]:
+    """Split a comma-separated targets string (cached; do not modify the result)."""
+    return [t.strip() for t in targets.split(",") if t.strip()]
+
+
+# Service data that removes the task notification from a device
+_CLEAR_TASK_STARTED: dict[str, Any] = {
+    ATTR_MESSAGE: "clear_notification",
+    ATTR_DATA: {"tag": "routinely_task_started"},
+}
+
+
+class _NotificationFlags(NamedTuple):
+    """Which auxiliary notification channels are enabled."""
+
+    tts: bool
+    browser_mod: bool
+    persistent: bool
+
+
 class RoutinelyNotifications:
     """Handle notifications for Routinely."""
 
@@ -45,7 +214,46 @@ class RoutinelyNotifications:
         """Initialize notification handler."""
         self.hass = hass
         self.storage = storage
-        self._active_routine_targets: str | None = None
+        # Parsed when set; None means use the global targets
+        self._active_routine_targets: list[str] | None = None
+        # Parsed settings, rebuilt when storage.settings_version moves on
+        self._settings_version = -1
+        self._targets_cache: list[str] | None = None
+        self._flags_cache: _NotificationFlags | None = None
+        # Service registry lookups, reset when a service is (un)registered
+        self._browser_mod_available: bool | None = None
+        self._tts_service: str | None = None
+        # Batched pushes keyed by (target, notification_type); newest wins
+        self._pending: dict[tuple[str, str], tuple[Any, ...]] = {}
+        self._flush_handle: asyncio.TimerHandle | None = None
+
+    @callback
+    def async_track_services(self) -> Callable[[], None]:
+        """Keep cached service lookups current as services come and go.
+
+        Returns:
+            Callable that stops listening
+        """
+        unsubscribers = [
+            self.hass.bus.async_listen(event_type, self._async_service_changed)
+            for event_type in (EVENT_SERVICE_REGISTERED, EVENT_SERVICE_REMOVED)
+        ]
+
+        @callback
+        def unsubscribe() -> None:
+            for unsubscriber in unsubscribers:
+                unsubscriber()
+
+        return unsubscribe
+
+    @callback
+    def _async_service_changed(self, event: Event) -> None:
+        """Forget cached lookups for the domain whose services changed."""
+        domain = event.data.get(ATTR_DOMAIN)
+        if domain == "tts":
+            self._tts_service = None
+        elif domain == "browser_mod":
+            self._browser_mod_available = None
 
     def set_active_routine_targets(self, targets: str | None) -> None:
         """Set notification targets for the active routine.
@@ -53,21 +261,39 @@ class RoutinelyNotifications:
         Args:
             targets: Comma-separated targets, or None to use global defaults
         """
-        self._active_routine_targets = targets
+        self._active_routine_targets = _split_targets(targets) if targets else None
+        self._targets_cache = None
         _log.debug("Active routine targets set", targets=targets)
 
     def clear_active_routine_targets(self) -> None:
         """Clear routine-specific targets (use global defaults)."""
         self._active_routine_targets = None
+        self._targets_cache = None
+
+    def _check_settings_version(self) -> None:
+        """Drop cached settings if storage settings changed since parsing."""
+        version = self.storage.settings_version
+        if version != self._settings_version:
+            self._settings_version = version
+            self._targets_cache = None
+            self._flags_cache = None
 
     def _get_targets(self) -> list[str]:
         """Get notification targets from settings.
         
         Uses routine-specific targets if set, otherwise global targets.
+        The parsed list is cached and shared, so callers must not modify it.
         """
+        self._check_settings_version()
+        if self._targets_cache is None:
+            self._targets_cache = self._parse_targets()
+        return self._targets_cache
+
+    def _parse_targets(self) -> list[str]:
+        """Parse the routine-specific or global targets setting."""
         # Check for routine-specific targets first
-        if self._active_routine_targets:
-            return [t.strip() for t in self._active_routine_targets.split(",") if t.strip()]
+        if self._active_routine_targets is not None:
+            return self._active_routine_targets
         
         # Fall back to global targets
         targets = self.storage.get_setting(CONF_NOTIFICATION_TARGETS, "")
@@ -75,23 +301,20 @@ class RoutinelyNotifications:
             # Handle comma-separated string
             if not targets:
                 return []
-            return [t.strip() for t in targets.split(",") if t.strip()]
+            return _split_targets(targets)
         return targets or []
 
-    def _tts_enabled(self) -> bool:
-        """Check if TTS via speaker is enabled."""
-        return bool(
-            self.storage.get_setting(CONF_ENABLE_TTS, False)
-            and self.storage.get_setting(CONF_TTS_ENTITY, "")
-        )
-
-    def _browser_mod_tts_enabled(self) -> bool:
-        """Check if browser_mod TTS is enabled."""
-        return bool(self.storage.get_setting(CONF_ENABLE_BROWSER_MOD_TTS, False))
-
-    def _ha_persistent_enabled(self) -> bool:
-        """Check if HA persistent notifications (toasts) are enabled."""
-        return bool(self.storage.get_setting(CONF_ENABLE_HA_PERSISTENT, False))
+    def _flags(self) -> _NotificationFlags:
+        """Get which TTS, browser_mod and persistent channels are enabled."""
+        self._check_settings_version()
+        if self._flags_cache is None:
+            get = self.storage.get_setting
+            self._flags_cache = _NotificationFlags(
+                tts=bool(get(CONF_ENABLE_TTS, False) and get(CONF_TTS_ENTITY, "")),
+                browser_mod=bool(get(CONF_ENABLE_BROWSER_MOD_TTS, False)),
+                persistent=bool(get(CONF_ENABLE_HA_PERSISTENT, False)),
+            )
+        return self._flags_cache
 
     async def _speak_tts(self, message: str) -> None:
         """Speak message via configured TTS entity (HomePod, Google Home, etc).
@@ -99,47 +322,34 @@ class RoutinelyNotifications:
         This provides TTS for iOS users since iOS doesn't support TTS in notifications.
         Also useful for any user who wants announcements on smart speakers.
         """
-        if not self._tts_enabled():
+        if not self._flags().tts:
             return
 
         tts_entity = self.storage.get_setting(CONF_TTS_ENTITY, "")
         if not tts_entity:
             return
 
+        # Prefer tts.speak (newer HA versions), which works with media_player
+        # entities; fall back to tts.cloud_say for cloud TTS
+        if self._tts_service is None:
+            self._tts_service = (
+                "speak" if self.hass.services.has_service("tts", "speak") else "cloud_say"
+            )
+        service_data = {"entity_id": tts_entity, "message": message}
+        if self._tts_service == "speak":
+            service_data["media_player_entity_id"] = tts_entity
+
         try:
-            # Try tts.speak service first (newer HA versions)
-            # This works with media_player entities
             await self.hass.services.async_call(
-                "tts",
-                "speak",
-                {
-                    "entity_id": tts_entity,
-                    "message": message,
-                    "media_player_entity_id": tts_entity,
-                },
-                blocking=False,
+                "tts", self._tts_service, service_data, blocking=False
             )
-            _log.debug("TTS spoken via tts.speak", entity=tts_entity)
+            _log.debug("TTS spoken", service=f"tts.{self._tts_service}", entity=tts_entity)
         except Exception as err:
-            _log.debug("tts.speak failed, trying cloud_say", error=str(err))
-            try:
-                # Fallback: try tts.cloud_say for cloud TTS
-                await self.hass.services.async_call(
-                    "tts",
-                    "cloud_say",
-                    {
-                        "entity_id": tts_entity,
-                        "message": message,
-                    },
-                    blocking=False,
-                )
-                _log.debug("TTS spoken via tts.cloud_say", entity=tts_entity)
-            except Exception as err2:
-                _log.error(
-                    "Failed to speak TTS",
-                    entity=tts_entity,
-                    error=str(err2),
-                )
+            _log.error(
+                "Failed to speak TTS",
+                entity=tts_entity,
+                error=str(err),
+            )
 
     async def _speak_browser_mod_tts(self, message: str) -> None:
         """Speak message via browser_mod using Web Speech API.
@@ -150,28 +360,20 @@ class RoutinelyNotifications:
         Uses the browser's built-in speechSynthesis API to speak text directly
         on the device - perfect for iOS devices viewing HA dashboards.
         """
-        if not self._browser_mod_tts_enabled():
+        if not self._flags().browser_mod:
             return
 
         # Check if browser_mod is available
-        if not self.hass.services.has_service("browser_mod", "javascript"):
+        if self._browser_mod_available is None:
+            self._browser_mod_available = self.hass.services.has_service(
+                "browser_mod", "javascript"
+            )
+        if not self._browser_mod_available:
             _log.debug("browser_mod.javascript service not available")
             return
 
-        # Escape the message for JavaScript string
-        escaped_message = message.replace("\\", "\\\\").replace("'", "\\'").replace("\n", " ")
-        
-        # JavaScript code to speak using Web Speech API
-        # This works on iOS Safari, Chrome, Firefox, Edge, etc.
-        js_code = f"""
-            if ('speechSynthesis' in window) {{
-                const utterance = new SpeechSynthesisUtterance('{escaped_message}');
-                utterance.rate = 1.0;
-                utterance.pitch = 1.0;
-                utterance.volume = 1.0;
-                speechSynthesis.speak(utterance);
-            }}
-        """
+        # json.dumps yields a quoted, fully escaped JavaScript string literal
+        js_code = _BROWSER_MOD_TTS_JS.replace("{message}", json.dumps(message))
 
         try:
             # Call browser_mod.javascript on all registered browsers
@@ -196,7 +398,7 @@ class RoutinelyNotifications:
         This shows a notification in the HA UI sidebar and as a toast message.
         Useful for users who keep HA open on a tablet or browser.
         """
-        if not self._ha_persistent_enabled():
+        if not self._flags().persistent:
             return
 
         notification_id = f"routinely_{notification_type}"
@@ -221,7 +423,7 @@ class RoutinelyNotifications:
         notification_type: str,
         title: str,
         message: str,
-        actions: list[NotificationAction] | None = None,
+        actions: Sequence[NotificationAction] | None = None,
         data: dict[str, Any] | None = None,
         tts_message: str | None = None,
         critical: bool = False,
@@ -241,7 +443,7 @@ class RoutinelyNotifications:
         """
         # Use override targets if provided, otherwise use global
         if override_targets:
-            targets = [t.strip() for t in override_targets.split(",") if t.strip()]
+            targets = _split_targets(override_targets)
         else:
             targets = self._get_targets()
         
@@ -258,61 +460,135 @@ class RoutinelyNotifications:
 
         tts_text = tts_message or message
 
+        channels = []
+        flags = self._flags()
+
         # Speak via TTS entity if configured (for iOS users and smart speakers)
-        if tts_text and self._tts_enabled():
-            await self._speak_tts(tts_text)
+        if tts_text and flags.tts:
+            channels.append(self._speak_tts(tts_text))
 
         # Speak via browser_mod if configured (for iOS Safari and other browsers)
-        if tts_text and self._browser_mod_tts_enabled():
-            await self._speak_browser_mod_tts(tts_text)
+        if tts_text and flags.browser_mod:
+            channels.append(self._speak_browser_mod_tts(tts_text))
 
         # Send HA persistent notification (toast) if configured
-        if self._ha_persistent_enabled():
-            await self._send_ha_persistent(notification_type, title, message)
-
-        for target in targets:
-            try:
-                # Build platform-specific notification data per target
-                notification_data = self._build_notification_data(
-                    notification_type=notification_type,
-                    actions=actions,
-                    tts_message=tts_text,
-                    critical=critical,
-                    extra_data=data,
-                    target=target,
+        if flags.persistent:
+            channels.append(self._send_ha_persistent(notification_type, title, message))
+
+        # The payload is the same for every target, so build it once; only
+        # Android TTS targets need their own copy (see _dispatch_to_target)
+        notification_data = self._build_notification_data(
+            notification_type=notification_type,
+            actions=actions,
+            tts_message=tts_text,
+            critical=critical,
+            extra_data=data,
+        )
+        dispatch = (notification_type, title, message, notification_data, tts_text)
+        window = self.storage.get_setting(
+            CONF_NOTIFICATION_BATCH_WINDOW, DEFAULT_NOTIFICATION_BATCH_WINDOW
+        )
+        if critical or window <= 0:
+            # Send anything still buffered along with this push rather than
+            # holding it back; all of them go out concurrently
+            pushes = self._take_pending()
+            pushes.extend((target, dispatch) for target in targets)
+            channels.append(self._send_pushes(pushes))
+        else:
+            pending = self._pending
+            for target in targets:
+                key = (target, notification_type)
+                pending.pop(key, None)
+                pending[key] = dispatch
+            if self._flush_handle is None:
+                self._flush_handle = self.hass.loop.call_later(
+                    window / 1000, self.async_flush_pending
                 )
-                # For Android TTS, message must be "TTS" to trigger speech
-                # See: https://companion.home-assistant.io/docs/notifications/notifications-basic/#text-to-speech-notifications
-                effective_message = message
-                if self._is_android_target(target) and tts_text:
-                    # Use "TTS" to trigger speech mode on Android
-                    # The actual text is in data.tts_text
-                    effective_message = "TTS"
-                    # Store the original message for reference
-                    notification_data["message_text"] = message
-                
-                await self._send_to_target(target, title, effective_message, notification_data)
-                _log.debug("Notification sent", target=target, type=notification_type)
-            except Exception as err:
-                _log.error(
-                    "Failed to send notification",
-                    target=target,
-                    error=str(err),
+
+        # Pushes were only buffered and no side channel is on: nothing to wait for
+        if not channels:
+            return
+
+        # Each channel logs its own failures. Eager tasks run up to their
+        # first suspension immediately, so calls that don't need to wait
+        # skip a trip through the event loop.
+        await asyncio.gather(
+            *[
+                self.hass.async_create_task(channel, eager_start=True)
+                for channel in channels
+            ]
+        )
+
+    def _take_pending(self) -> list[tuple[str, tuple[Any, ...]]]:
+        """Cancel the batch timer and return everything buffered as (target, dispatch)."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        pending, self._pending = self._pending, {}
+        return [(target, dispatch) for (target, _), dispatch in pending.items()]
+
+    @callback
+    def async_flush_pending(self) -> None:
+        """Send the buffered pushes now, when the batching window closes or on unload."""
+        if pushes := self._take_pending():
+            self.hass.async_create_task(self._send_pushes(pushes), eager_start=True)
+
+    async def _send_pushes(self, pushes: list[tuple[str, tuple[Any, ...]]]) -> None:
+        """Send pushes concurrently and log all failed targets in one record."""
+        results = await asyncio.gather(
+            *[
+                self.hass.async_create_task(
+                    self._dispatch_to_target(target, *dispatch), eager_start=True
                 )
+                for target, dispatch in pushes
+            ],
+            return_exceptions=True,
+        )
+        failures = [
+            (target, str(result))
+            for (target, _), result in zip(pushes, results)
+            if result is not None
+        ]
+        if failures:
+            _log.error("Failed to send notifications", failures=failures)
+
+    async def _dispatch_to_target(
+        self,
+        target: str,
+        notification_type: str,
+        title: str,
+        message: str,
+        notification_data: dict[str, Any],
+        tts_text: str,
+    ) -> None:
+        """Send one target's notification."""
+        # For Android TTS, message must be "TTS" to trigger speech
+        # See: https://companion.home-assistant.io/docs/notifications/notifications-basic/#text-to-speech-notifications
+        effective_message = message
+        if self._is_android_target(target) and tts_text:
+            # Use "TTS" to trigger speech mode on Android
+            # The actual text is in data.tts_text
+            effective_message = "TTS"
+            # Store the original message for reference
+            notification_data = {**notification_data, "message_text": message}
+
+        await self._send_to_target(target, title, effective_message, notification_data)
+        _log.debug("Notification sent", target=target, type=notification_type)
 
     @staticmethod
+    @lru_cache(maxsize=64)
     def _is_android_target(target: str) -> bool:
         """Check if target is likely an Android device.
         
         Android device IDs often contain 'android' or lack 'iphone/ipad'.
         This is heuristic - users can override via settings if needed.
+        Targets are few and stable, so results are cached per target.
         """
-        target_lower = target.lower()
         # Explicit android indicators
-        if "android" in target_lower or "pixel" in target_lower or "galaxy" in target_lower:
+        if _ANDROID_RE.search(target):
             return True
         # iOS indicators - if present, it's not Android
-        if "iphone" in target_lower or "ipad" in target_lower or "ios" in target_lower:
+        if _IOS_RE.search(target):
             return False
         # Default to Android for mobile_app_ targets without iOS indicators
         # (Android is more common and benefits more from TTS critical)
@@ -332,30 +608,30 @@ class RoutinelyNotifications:
             ATTR_DATA: data,
         }
 
-        # Determine service to call
+        domain, service = self._resolve_service(target)
+        await self.hass.services.async_call(domain, service, service_data)
+
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def _resolve_service(target: str) -> tuple[str, str]:
+        """Get the (domain, service) to call for a target."""
         if target.startswith("mobile_app_"):
             # Mobile app notification
-            await self.hass.services.async_call(
-                "notify",
-                target,
-                service_data,
-            )
-        elif "." in target:
+            return "notify", target
+        if "." in target:
             # Full service path (e.g., notify.my_service)
             domain, service = target.split(".", 1)
-            await self.hass.services.async_call(domain, service, service_data)
-        else:
-            # Assume it's a notify service name
-            await self.hass.services.async_call("notify", target, service_data)
+            return domain, service
+        # Assume it's a notify service name
+        return "notify", target
 
     def _build_notification_data(
         self,
         notification_type: str,
-        actions: list[NotificationAction] | None,
+        actions: Sequence[NotificationAction] | None,
         tts_message: str,
         critical: bool,
         extra_data: dict[str, Any] | None,
-        target: str = "",
     ) -> dict[str, Any]:
         """Build cross-platform notification data with TTS support.
         
@@ -374,8 +650,34 @@ class RoutinelyNotifications:
         - tts_text: "<message>" - text to speak
         - message: "TTS" - triggers TTS mode (handled in caller)
         """
-        is_android = self._is_android_target(target)
-        
+        data = {
+            **self._notification_template(
+                notification_type, critical, tuple(actions) if actions else ()
+            ),
+            "tts_text": tts_message,
+            # Legacy TTS fields for compatibility
+            "tts": tts_message,
+            "speak": tts_message,
+        }
+
+        # Merge extra data (allows per-notification overrides)
+        if extra_data:
+            data.update(extra_data)
+
+        return data
+
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _notification_template(
+        notification_type: str,
+        critical: bool,
+        actions: tuple[NotificationAction, ...],
+    ) -> dict[str, Any]:
+        """Build the message-independent part of the notification data.
+
+        Cached per (type, critical, actions), so callers must copy the dict
+        before adding to it and must not mutate its nested values.
+        """
         data: dict[str, Any] = {
             "tag": f"routinely_{notification_type}",
             "group": "routinely",
@@ -385,34 +687,10 @@ class RoutinelyNotifications:
         # iOS Critical Notifications (TOP PRIORITY)
         # See: https://companion.home-assistant.io/docs/notifications/critical-notifications/#ios
         # ============================================================
-        if critical:
-            # Critical alert: bypasses DND, plays sound even when muted
-            data["push"] = {
-                "sound": {
-                    "name": "default",
-                    "critical": 1,
-                    "volume": 1.0,  # Maximum volume
-                },
-                # Critical interruption level - highest priority on iOS
-                # Breaks through all DND/Focus modes
-                "interruption-level": "critical",
-            }
-        else:
-            data["push"] = {
-                "sound": {
-                    "name": "default",
-                    "critical": 0,
-                    "volume": 0.8,
-                },
-                # time-sensitive: May break through some Focus modes
-                # active: Normal notification
-                "interruption-level": "time-sensitive",
-            }
+        data["push"] = _PUSH_CRITICAL if critical else _PUSH_NORMAL
 
         # iOS announcement - Siri speaks this on AirPods/CarPlay/HomePod
-        data["apns_headers"] = {
-            "apns-push-type": "alert",
-        }
+        data["apns_headers"] = _APNS_HEADERS
 
         # ============================================================
         # Android Critical Notifications with TTS (SECOND PRIORITY)
@@ -430,76 +708,23 @@ class RoutinelyNotifications:
             # 3. Speak the tts_text
             # 4. Revert volume to original level after speaking
             data["media_stream"] = "alarm_stream_max"
-            data["tts_text"] = tts_message
             data["channel"] = "alarm_stream"  # Use alarm channel
         else:
             # Non-critical: standard TTS on notification stream
-            data["tts_text"] = tts_message
             data["channel"] = "routinely"
 
-        # Legacy TTS fields for compatibility
-        data["tts"] = tts_message
-        data["speak"] = tts_message
-
         # Persistent notification (stays until dismissed)
         data["persistent"] = notification_type in ("task_started", "routine_paused")
         data["sticky"] = data["persistent"]
 
         # Actionable notification buttons
         if actions:
-            data["actions"] = []
-            for action in actions:
-                action_data = {
-                    "action": action.value,
-                    "title": self._get_action_title(action),
-                }
-                # iOS SF Symbols icon
-                icon = self._get_action_icon(action)
-                if icon:
-                    action_data["icon"] = icon
-                # Destructive actions show in red on iOS
-                if action in (NotificationAction.CANCEL, NotificationAction.SKIP):
-                    action_data["destructive"] = True
-                # Auth required actions need device unlock
-                if action in (NotificationAction.CANCEL,):
-                    action_data["authenticationRequired"] = True
-                data["actions"].append(action_data)
-
-        # Merge extra data (allows per-notification overrides)
-        if extra_data:
-            data.update(extra_data)
+            data["actions"] = [_ACTION_PAYLOADS[action] for action in actions]
 
         return data
 
-    @staticmethod
-    def _get_action_title(action: NotificationAction) -> str:
-        """Get display title for action button."""
-        titles = {
-            NotificationAction.PAUSE: "Pause",
-            NotificationAction.RESUME: "Resume",
-            NotificationAction.SKIP: "Skip",
-            NotificationAction.COMPLETE: "Done",
-            NotificationAction.CONFIRM: "Continue",
-            NotificationAction.SNOOZE: "+30s",
-            NotificationAction.CANCEL: "Cancel",
-        }
-        return titles.get(action, action.value)
-
-    @staticmethod
-    def _get_action_icon(action: NotificationAction) -> str:
-        """Get icon for action button."""
-        icons = {
-            NotificationAction.PAUSE: "sfsymbols:pause.fill",
-            NotificationAction.RESUME: "sfsymbols:play.fill",
-            NotificationAction.SKIP: "sfsymbols:forward.fill",
-            NotificationAction.COMPLETE: "sfsymbols:checkmark.circle.fill",
-            NotificationAction.CONFIRM: "sfsymbols:arrow.right.circle.fill",
-            NotificationAction.SNOOZE: "sfsymbols:clock.badge.plus",
-            NotificationAction.CANCEL: "sfsymbols:xmark.circle.fill",
-        }
-        return icons.get(action, "")
-
     # High-level notification methods
+    # Each returns before building any text when there is nobody to notify.
 
     async def notify_routine_started(
         self,
@@ -508,8 +733,10 @@ class RoutinelyNotifications:
         estimated_duration: int,
     ) -> None:
         """Send routine started notification."""
+        if not self._get_targets():
+            return
         duration_min = round(estimated_duration / 60, 1)
-        message = DEFAULT_MESSAGES["routine_started"].format(
+        message = _FORMATTERS["routine_started"](
             routine_name=routine.name,
             total_tasks=total_tasks,
             duration_min=duration_min,
@@ -532,10 +759,16 @@ class RoutinelyNotifications:
         total_tasks: int,
     ) -> None:
         """Send task started notification."""
-        duration_formatted = self._format_duration(task.duration)
+        if not self._get_targets():
+            return
+        duration_formatted = format_duration(task.duration)
         
         # Use custom message if set on task, otherwise default
-        message = (task.notification_message or DEFAULT_MESSAGES["task_started"]).format(
+        message = (
+            task.notification_message.format
+            if task.notification_message
+            else _FORMATTERS["task_started"]
+        )(
             task_name=task.name,
             duration_formatted=duration_formatted,
             routine_name=routine_name,
@@ -544,7 +777,7 @@ class RoutinelyNotifications:
         )
         
         # TTS announcement
-        tts = task.tts_message or f"{task.name}. {self._format_duration_spoken(task.duration)}."
+        tts = task.tts_message or f"{task.name}. {format_duration_spoken(task.duration)}."
 
         actions = [NotificationAction.SKIP, NotificationAction.PAUSE]
         if task.advancement_mode.value == "manual":
@@ -559,26 +792,29 @@ class RoutinelyNotifications:
             critical=False,
         )
 
+    async def _notify_task(self, notification_type: str, task: Task, **fields: Any) -> None:
+        """Send a task notification described by _TASK_NOTIFICATIONS."""
+        if not self._get_targets():
+            return
+        spec = _TASK_NOTIFICATIONS[notification_type]
+        message = spec.message(task_name=task.name, **fields)
+
+        await self.async_send(
+            notification_type=notification_type,
+            title=spec.title(task_name=task.name),
+            message=message,
+            tts_message=f"{message}.",
+            critical=spec.critical,
+            actions=spec.actions,
+        )
+
     async def notify_task_ending_soon(
         self,
         task: Task,
         seconds_remaining: int,
     ) -> None:
         """Send task ending soon warning."""
-        message = DEFAULT_MESSAGES["task_ending_soon"].format(
-            task_name=task.name,
-            seconds_remaining=seconds_remaining,
-        )
-        tts = f"{task.name} ending in {seconds_remaining} seconds."
-
-        await self.async_send(
-            notification_type="task_ending",
-            title=f"⚠️ {task.name}",
-            message=message,
-            tts_message=tts,
-            critical=True,
-            actions=[NotificationAction.SKIP, NotificationAction.COMPLETE],
-        )
+        await self._notify_task("task_ending", task, seconds_remaining=seconds_remaining)
 
     async def notify_time_until_task(
         self,
@@ -586,17 +822,8 @@ class RoutinelyNotifications:
         seconds_until: int,
     ) -> None:
         """Send notification about upcoming task."""
-        time_str = self._format_duration_spoken(seconds_until)
-        message = f"{time_str} until {task.name}"
-        tts = f"{time_str} until {task.name}."
-
-        await self.async_send(
-            notification_type="task_upcoming",
-            title=f"⏰ {task.name}",
-            message=message,
-            tts_message=tts,
-            critical=False,
-            actions=[NotificationAction.PAUSE],
+        await self._notify_task(
+            "task_upcoming", task, time_str=format_duration_spoken(seconds_until)
         )
 
     async def notify_time_remaining(
@@ -605,17 +832,8 @@ class RoutinelyNotifications:
         seconds_remaining: int,
     ) -> None:
         """Send notification about time remaining in task."""
-        time_str = self._format_duration_spoken(seconds_remaining)
-        message = f"{time_str} remaining in {task.name}"
-        tts = f"{time_str} remaining in {task.name}."
-
-        await self.async_send(
-            notification_type="task_remaining",
-            title=f"⏱️ {task.name}",
-            message=message,
-            tts_message=tts,
-            critical=False,
-            actions=[NotificationAction.COMPLETE, NotificationAction.SKIP],
+        await self._notify_task(
+            "task_remaining", task, time_str=format_duration_spoken(seconds_remaining)
         )
 
     async def notify_task_overdue(
@@ -624,17 +842,8 @@ class RoutinelyNotifications:
         seconds_overdue: int,
     ) -> None:
         """Send notification that task is overdue."""
-        time_str = self._format_duration_spoken(seconds_overdue)
-        message = f"{time_str} over on {task.name}"
-        tts = f"{time_str} over on {task.name}."
-
-        await self.async_send(
-            notification_type="task_overdue",
-            title=f"⚠️ {task.name} Overdue",
-            message=message,
-            tts_message=tts,
-            critical=True,
-            actions=[NotificationAction.COMPLETE, NotificationAction.SKIP],
+        await self._notify_task(
+            "task_overdue", task, time_str=format_duration_spoken(seconds_overdue)
         )
 
     async def notify_task_complete(
@@ -642,16 +851,7 @@ class RoutinelyNotifications:
         task: Task,
     ) -> None:
         """Send notification that task has completed."""
-        message = f"{task.name} completed"
-        tts = f"{task.name} completed."
-
-        await self.async_send(
-            notification_type="task_completed",
-            title=f"✅ {task.name}",
-            message=message,
-            tts_message=tts,
-            critical=False,
-        )
+        await self._notify_task("task_completed", task)
 
     async def notify_task_awaiting_input(
         self,
@@ -660,15 +860,17 @@ class RoutinelyNotifications:
         confirm_window: int | None = None,
     ) -> None:
         """Send notification that task needs user input."""
+        if not self._get_targets():
+            return
         if is_confirm_mode:
-            message = DEFAULT_MESSAGES["task_complete_confirm"].format(
+            message = _FORMATTERS["task_complete_confirm"](
                 task_name=task.name,
                 confirm_window=confirm_window or 30,
             )
             tts = f"{task.name} complete. Tap continue or snooze."
             actions = [NotificationAction.CONFIRM, NotificationAction.SNOOZE]
         else:
-            message = DEFAULT_MESSAGES["task_complete_manual"].format(task_name=task.name)
+            message = _FORMATTERS["task_complete_manual"](task_name=task.name)
             tts = f"{task.name} timer finished. Mark complete when ready."
             actions = [NotificationAction.COMPLETE, NotificationAction.SKIP]
 
@@ -683,7 +885,9 @@ class RoutinelyNotifications:
 
     async def notify_routine_paused(self, routine: Routine) -> None:
         """Send routine paused notification."""
-        message = DEFAULT_MESSAGES["routine_paused"].format(routine_name=routine.name)
+        if not self._get_targets():
+            return
+        message = _FORMATTERS["routine_paused"](routine_name=routine.name)
         tts = f"{routine.name} paused."
 
         await self.async_send(
@@ -700,7 +904,9 @@ class RoutinelyNotifications:
         current_task: Task,
     ) -> None:
         """Send routine resumed notification."""
-        message = DEFAULT_MESSAGES["routine_resumed"].format(
+        if not self._get_targets():
+            return
+        message = _FORMATTERS["routine_resumed"](
             routine_name=routine.name,
             current_task=current_task.name,
         )
@@ -722,14 +928,16 @@ class RoutinelyNotifications:
         total_duration: int,
     ) -> None:
         """Send routine completed notification."""
-        duration_formatted = self._format_duration(total_duration)
-        message = DEFAULT_MESSAGES["routine_completed"].format(
+        if not self._get_targets():
+            return
+        duration_formatted = format_duration(total_duration)
+        message = _FORMATTERS["routine_completed"](
             routine_name=routine.name,
             tasks_completed=tasks_completed,
             duration_formatted=duration_formatted,
         )
         
-        tts = f"{routine.name} complete! {tasks_completed} tasks finished in {self._format_duration_spoken(total_duration)}."
+        tts = f"{routine.name} complete! {tasks_completed} tasks finished in {format_duration_spoken(total_duration)}."
         if tasks_skipped > 0:
             tts += f" {tasks_skipped} tasks skipped."
 
@@ -742,7 +950,9 @@ class RoutinelyNotifications:
 
     async def notify_routine_cancelled(self, routine: Routine) -> None:
         """Send routine cancelled notification."""
-        message = DEFAULT_MESSAGES["routine_cancelled"].format(routine_name=routine.name)
+        if not self._get_targets():
+            return
+        message = _FORMATTERS["routine_cancelled"](routine_name=routine.name)
         tts = f"{routine.name} cancelled."
 
         await self.async_send(
@@ -754,43 +964,22 @@ class RoutinelyNotifications:
 
     async def clear_notifications(self) -> None:
         """Clear all Routinely notifications."""
+        # Don't let a buffered task push reappear after it has been cleared
+        for key in [key for key in self._pending if key[1] == "task_started"]:
+            del self._pending[key]
         targets = self._get_targets()
-        for target in targets:
-            try:
-                # Send clear command
-                await self.hass.services.async_call(
-                    "notify",
-                    target,
-                    {
-                        ATTR_MESSAGE: "clear_notification",
-                        ATTR_DATA: {"tag": "routinely_task_started"},
-                    },
+        if not targets:
+            return
+        results = await asyncio.gather(
+            *[
+                self.hass.async_create_task(
+                    self.hass.services.async_call("notify", target, _CLEAR_TASK_STARTED),
+                    eager_start=True,
                 )
-            except Exception:
-                pass
-
-    @staticmethod
-    def _format_duration(seconds: int) -> str:
-        """Format seconds as human-readable duration."""
-        if seconds < 60:
-            return f"{seconds}s"
-        minutes = seconds // 60
-        secs = seconds % 60
-        if secs == 0:
-            return f"{minutes}m"
-        return f"{minutes}m {secs}s"
-
-    @staticmethod
-    def _format_duration_spoken(seconds: int) -> str:
-        """Format duration for TTS (spoken)."""
-        if seconds < 60:
-            return f"{seconds} seconds"
-        minutes = seconds // 60
-        secs = seconds % 60
-        if minutes == 1:
-            result = "1 minute"
-        else:
-            result = f"{minutes} minutes"
-        if secs > 0:
-            result += f" {secs} seconds"
-        return result
+                for target in targets
+            ],
+            return_exceptions=True,
+        )
+        for target, result in zip(targets, results):
+            if result is not None:
+                _log.debug("Failed to clear notification", target=target, error=str(result))
@@ -4,20 +4,54 @@ from __future__ import annotations
 from typing import TYPE_CHECKING, Any
 
 from homeassistant.components.sensor import SensorEntity
+from homeassistant.core import callback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN
+from .formatting import format_duration, format_duration_hms
 from .logger import Loggers
 
 if TYPE_CHECKING:
     from homeassistant.config_entries import ConfigEntry
     from homeassistant.core import HomeAssistant
+    from homeassistant.helpers.device_registry import DeviceInfo
     from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
     from .coordinator import RoutinelyCoordinator
+    from .models import Routine, Task
 
 _log = Loggers.sensor
 
+# Coordinator data keys exposed as attributes by the status sensor
+_STATUS_ATTRIBUTES = (
+    "routine_id",
+    "routine_name",
+    "routine_icon",
+    "current_task_index",
+    "total_tasks",
+    "completed_tasks",
+    "skipped_tasks",
+    "elapsed_time",
+    "started_at",
+    "confirm_window_active",
+)
+
+# (attribute name, coordinator data key) pairs for the current task sensor
+_CURRENT_TASK_ATTRIBUTES = (
+    ("icon", "current_task_icon"),
+    ("duration", "current_task_duration"),
+    ("advancement_mode", "advancement_mode"),
+    ("task_elapsed_time", "task_elapsed_time"),
+    ("task_index", "current_task_index"),
+    ("total_tasks", "total_tasks"),
+)
+
+# Icon shown by the current task sensor when there is no task icon
+_DEFAULT_TASK_ICON = "mdi:checkbox-marked-circle-outline"
+
+# Coordinator data keys exposed (defaulting to 0) by the progress sensor
+_PROGRESS_ATTRIBUTES = ("completed_tasks", "skipped_tasks", "total_tasks")
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -28,13 +62,20 @@ async def async_setup_entry(
     _log.debug("Setting up sensor entities")
     coordinator: RoutinelyCoordinator = hass.data[DOMAIN][entry.entry_id]
 
+    device_info: DeviceInfo = {
+        "identifiers": {(DOMAIN, entry.entry_id)},
+        "name": "Routinely",
+        "manufacturer": "Routinely",
+        "model": "Timer-Guided Routine Execution",
+    }
+
     entities = [
-        RoutinelyStatusSensor(coordinator, entry),
-        RoutinelyCurrentTaskSensor(coordinator, entry),
-        RoutinelyTimeRemainingSensor(coordinator, entry),
-        RoutinelyProgressSensor(coordinator, entry),
-        RoutinelyTaskCountSensor(coordinator, entry),
-        RoutinelyRoutineCountSensor(coordinator, entry),
+        RoutinelyStatusSensor(coordinator, entry, device_info),
+        RoutinelyCurrentTaskSensor(coordinator, entry, device_info),
+        RoutinelyTimeRemainingSensor(coordinator, entry, device_info),
+        RoutinelyProgressSensor(coordinator, entry, device_info),
+        RoutinelyTaskCountSensor(coordinator, entry, device_info),
+        RoutinelyRoutineCountSensor(coordinator, entry, device_info),
     ]
     async_add_entities(entities)
     _log.debug("Sensor entities registered", count=len(entities))
@@ -44,110 +85,134 @@ class RoutinelyBaseSensor(CoordinatorEntity, SensorEntity):
     """Base class for Routinely sensors."""
 
     _attr_has_entity_name = True
+    # Coordinator data keys the sensor's state and attributes are built from
+    _watched_keys: tuple[str, ...] = ()
 
     def __init__(
         self,
         coordinator: RoutinelyCoordinator,
         entry: ConfigEntry,
+        device_info: DeviceInfo,
         name: str,
         key: str,
     ) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator)
-        self._key = key
         self._attr_name = name
         self._attr_unique_id = f"{entry.entry_id}_{key}"
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, entry.entry_id)},
-            "name": "Routinely",
-            "manufacturer": "Routinely",
-            "model": "Timer-Guided Routine Execution",
-        }
+        self._attr_device_info = device_info
+        self._last_written: tuple | None = None
+        self._update_from_data(coordinator.data)
+
+    def _update_from_data(self, data: dict[str, Any]) -> None:
+        """Cache the values derived from coordinator data on the entity."""
+        self._attr_extra_state_attributes = self._attributes_from(data)
+
+    def _attributes_from(self, data: dict[str, Any]) -> dict[str, Any] | None:
+        """Build the state attributes from coordinator data."""
+        return None
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write state only when a coordinator key this sensor reads changed.
+
+        Attributes are rebuilt here, once per change, rather than on every read.
+        """
+        data = self.coordinator.data
+        written = (self.available, *[data.get(key) for key in self._watched_keys])
+        if written == self._last_written:
+            return
+        self._last_written = written
+        self._update_from_data(data)
+        self.async_write_ha_state()
 
 
 class RoutinelyStatusSensor(RoutinelyBaseSensor):
     """Sensor showing the current routine execution status."""
 
     _attr_icon = "mdi:playlist-play"
+    _watched_keys = ("status", *_STATUS_ATTRIBUTES)
 
-    def __init__(self, coordinator: RoutinelyCoordinator, entry: ConfigEntry) -> None:
+    def __init__(
+        self,
+        coordinator: RoutinelyCoordinator,
+        entry: ConfigEntry,
+        device_info: DeviceInfo,
+    ) -> None:
         """Initialize the status sensor."""
-        super().__init__(coordinator, entry, "Status", "status")
+        super().__init__(coordinator, entry, device_info, "Status", "status")
 
     @property
     def native_value(self) -> str:
         """Return the current status."""
         return self.coordinator.data.get("status", "idle")
 
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return additional state attributes."""
-        data = self.coordinator.data
-        return {
-            "routine_id": data.get("routine_id"),
-            "routine_name": data.get("routine_name"),
-            "routine_icon": data.get("routine_icon"),
-            "current_task_index": data.get("current_task_index"),
-            "total_tasks": data.get("total_tasks"),
-            "completed_tasks": data.get("completed_tasks"),
-            "skipped_tasks": data.get("skipped_tasks"),
-            "elapsed_time": data.get("elapsed_time"),
-            "started_at": data.get("started_at"),
-            "confirm_window_active": data.get("confirm_window_active"),
-        }
+    def _attributes_from(self, data: dict[str, Any]) -> dict[str, Any]:
+        """Build the status attributes."""
+        return {key: data.get(key) for key in _STATUS_ATTRIBUTES}
 
 
 class RoutinelyCurrentTaskSensor(RoutinelyBaseSensor):
     """Sensor showing the current task name."""
 
-    def __init__(self, coordinator: RoutinelyCoordinator, entry: ConfigEntry) -> None:
+    _watched_keys = (
+        "current_task_name",
+        *(key for _, key in _CURRENT_TASK_ATTRIBUTES),
+    )
+
+    def __init__(
+        self,
+        coordinator: RoutinelyCoordinator,
+        entry: ConfigEntry,
+        device_info: DeviceInfo,
+    ) -> None:
         """Initialize the current task sensor."""
-        super().__init__(coordinator, entry, "Current Task", "current_task")
+        super().__init__(coordinator, entry, device_info, "Current Task", "current_task")
 
     @property
     def native_value(self) -> str | None:
         """Return the current task name."""
         return self.coordinator.data.get("current_task_name")
 
-    @property
-    def icon(self) -> str:
-        """Return the icon."""
-        return self.coordinator.data.get("current_task_icon") or "mdi:checkbox-marked-circle-outline"
+    def _update_from_data(self, data: dict[str, Any]) -> None:
+        """Cache the attributes and the task icon, falling back to a default."""
+        super()._update_from_data(data)
+        self._attr_icon = data.get("current_task_icon") or _DEFAULT_TASK_ICON
 
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return additional state attributes."""
-        data = self.coordinator.data
-        return {
-            "icon": data.get("current_task_icon"),
-            "duration": data.get("current_task_duration"),
-            "advancement_mode": data.get("advancement_mode"),
-            "task_elapsed_time": data.get("task_elapsed_time"),
-            "task_index": data.get("current_task_index"),
-            "total_tasks": data.get("total_tasks"),
-        }
+    def _attributes_from(self, data: dict[str, Any]) -> dict[str, Any]:
+        """Build the current task attributes."""
+        return {name: data.get(key) for name, key in _CURRENT_TASK_ATTRIBUTES}
 
 
 class RoutinelyTimeRemainingSensor(RoutinelyBaseSensor):
     """Sensor showing time remaining for current task."""
 
     _attr_icon = "mdi:timer-outline"
+    _watched_keys = (
+        "time_remaining_formatted",
+        "time_remaining",
+        "confirm_window_active",
+    )
 
-    def __init__(self, coordinator: RoutinelyCoordinator, entry: ConfigEntry) -> None:
+    def __init__(
+        self,
+        coordinator: RoutinelyCoordinator,
+        entry: ConfigEntry,
+        device_info: DeviceInfo,
+    ) -> None:
         """Initialize the time remaining sensor."""
-        super().__init__(coordinator, entry, "Time Remaining", "time_remaining")
+        super().__init__(coordinator, entry, device_info, "Time Remaining", "time_remaining")
 
     @property
     def native_value(self) -> str:
         """Return the formatted time remaining."""
-        return self.coordinator.data.get("time_remaining_formatted", "0:00")
+        return self.coordinator.data["time_remaining_formatted"]
 
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return additional state attributes."""
+    def _attributes_from(self, data: dict[str, Any]) -> dict[str, Any]:
+        """Build the time remaining attributes."""
         return {
-            "seconds": self.coordinator.data.get("time_remaining", 0),
-            "confirm_window_active": self.coordinator.data.get("confirm_window_active"),
+            "seconds": data.get("time_remaining", 0),
+            "confirm_window_active": data.get("confirm_window_active"),
         }
 
 
@@ -156,53 +221,57 @@ class RoutinelyProgressSensor(RoutinelyBaseSensor):
 
     _attr_icon = "mdi:progress-check"
     _attr_native_unit_of_measurement = "%"
+    _watched_keys = ("progress_percent", *_PROGRESS_ATTRIBUTES)
 
-    def __init__(self, coordinator: RoutinelyCoordinator, entry: ConfigEntry) -> None:
+    def __init__(
+        self,
+        coordinator: RoutinelyCoordinator,
+        entry: ConfigEntry,
+        device_info: DeviceInfo,
+    ) -> None:
         """Initialize the progress sensor."""
-        super().__init__(coordinator, entry, "Progress", "progress")
+        super().__init__(coordinator, entry, device_info, "Progress", "progress")
 
     @property
     def native_value(self) -> int:
         """Return the progress percentage."""
         return self.coordinator.data.get("progress_percent", 0)
 
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return additional state attributes."""
-        data = self.coordinator.data
-        return {
-            "completed_tasks": data.get("completed_tasks", 0),
-            "skipped_tasks": data.get("skipped_tasks", 0),
-            "total_tasks": data.get("total_tasks", 0),
-        }
+    def _attributes_from(self, data: dict[str, Any]) -> dict[str, Any]:
+        """Build the progress attributes."""
+        return {key: data.get(key, 0) for key in _PROGRESS_ATTRIBUTES}
 
 
 class RoutinelyTaskCountSensor(RoutinelyBaseSensor):
     """Sensor showing number of configured tasks with task list in attributes."""
 
     _attr_icon = "mdi:format-list-checks"
+    _watched_keys = ("revision",)
 
-    def __init__(self, coordinator: RoutinelyCoordinator, entry: ConfigEntry) -> None:
+    def __init__(
+        self,
+        coordinator: RoutinelyCoordinator,
+        entry: ConfigEntry,
+        device_info: DeviceInfo,
+    ) -> None:
         """Initialize the task count sensor."""
-        super().__init__(coordinator, entry, "Tasks", "task_count")
+        super().__init__(coordinator, entry, device_info, "Tasks", "task_count")
 
-    @property
-    def native_value(self) -> int:
-        """Return the number of tasks."""
+    def _update_from_data(self, data: dict[str, Any]) -> None:
+        """Cache the task count and task list; rebuilt only when storage changes."""
         tasks = self.coordinator.storage.get_tasks()
-        return len(tasks)
+        self._attr_native_value = len(tasks)
+        self._attr_extra_state_attributes = self._build_attributes(tasks)
 
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return task list as attributes."""
-        tasks = self.coordinator.storage.get_tasks()
+    def _build_attributes(self, tasks: dict[str, Task]) -> dict[str, Any]:
+        """Build the task list attributes."""
         task_list = []
         for task_id, task in tasks.items():
             task_list.append({
                 "id": task_id,
                 "name": task.name,
                 "duration": task.duration,
-                "duration_formatted": self._format_duration(task.duration),
+                "duration_formatted": format_duration(task.duration),
                 "icon": task.icon,
                 "advancement_mode": task.advancement_mode.value,
             })
@@ -211,37 +280,30 @@ class RoutinelyTaskCountSensor(RoutinelyBaseSensor):
             "task_ids": list(tasks.keys()),
         }
 
-    @staticmethod
-    def _format_duration(seconds: int) -> str:
-        """Format duration as human readable."""
-        if seconds < 60:
-            return f"{seconds}s"
-        minutes = seconds // 60
-        secs = seconds % 60
-        if secs == 0:
-            return f"{minutes}m"
-        return f"{minutes}m {secs}s"
-
 
 class RoutinelyRoutineCountSensor(RoutinelyBaseSensor):
     """Sensor showing number of configured routines with routine list in attributes."""
 
     _attr_icon = "mdi:playlist-check"
+    _watched_keys = ("revision",)
 
-    def __init__(self, coordinator: RoutinelyCoordinator, entry: ConfigEntry) -> None:
+    def __init__(
+        self,
+        coordinator: RoutinelyCoordinator,
+        entry: ConfigEntry,
+        device_info: DeviceInfo,
+    ) -> None:
         """Initialize the routine count sensor."""
-        super().__init__(coordinator, entry, "Routines", "routine_count")
+        super().__init__(coordinator, entry, device_info, "Routines", "routine_count")
 
-    @property
-    def native_value(self) -> int:
-        """Return the number of routines."""
+    def _update_from_data(self, data: dict[str, Any]) -> None:
+        """Cache the routine count and routine list; rebuilt only when storage changes."""
         routines = self.coordinator.storage.get_routines()
-        return len(routines)
+        self._attr_native_value = len(routines)
+        self._attr_extra_state_attributes = self._build_attributes(routines)
 
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return routine list as attributes."""
-        routines = self.coordinator.storage.get_routines()
+    def _build_attributes(self, routines: dict[str, Routine]) -> dict[str, Any]:
+        """Build the routine list and tag attributes."""
         storage = self.coordinator.storage
         routine_list = []
         all_tags = set()
@@ -254,7 +316,7 @@ class RoutinelyRoutineCountSensor(RoutinelyBaseSensor):
                 "task_ids": routine.task_ids,
                 "task_count": len(routine.task_ids),
                 "duration": duration,
-                "duration_formatted": self._format_duration(duration),
+                "duration_formatted": format_duration_hms(duration),
                 "tags": routine.tags,
                 "schedule_time": routine.schedule_time,
                 "schedule_days": routine.schedule_days,
@@ -269,17 +331,3 @@ class RoutinelyRoutineCountSensor(RoutinelyBaseSensor):
             "routine_ids": list(routines.keys()),
             "all_tags": sorted(all_tags),
         }
-
-    @staticmethod
-    def _format_duration(seconds: int) -> str:
-        """Format duration as human readable."""
-        if seconds < 60:
-            return f"{seconds}s"
-        minutes = seconds // 60
-        if minutes < 60:
-            return f"{minutes}m"
-        hours = minutes // 60
-        mins = minutes % 60
-        if mins == 0:
-            return f"{hours}h"
-        return f"{hours}h {mins}m"
@@ -1,8 +1,9 @@
 """Service handlers for the Routinely integration."""
 from __future__ import annotations
 
-from datetime import datetime
-from typing import TYPE_CHECKING
+from collections.abc import Callable, Mapping
+from copy import copy
+from typing import TYPE_CHECKING, Any
 
 import voluptuous as vol
 from homeassistant.core import ServiceCall, callback
@@ -56,7 +57,7 @@ from .const import (
     AdvancementMode,
     NotificationAction,
 )
-from .models import Routine, Task, generate_id
+from .models import Routine, Task, generate_id, now_iso
 
 if TYPE_CHECKING:
     from homeassistant.core import HomeAssistant
@@ -66,57 +67,59 @@ if TYPE_CHECKING:
 
 _log = Loggers.services
 
+# Validators shared between service schemas
+_ADVANCEMENT_MODE_VALUES = tuple(m.value for m in AdvancementMode)
+_DURATION_VALIDATOR = vol.All(
+    vol.Coerce(int), vol.Range(min=MIN_TASK_DURATION, max=MAX_TASK_DURATION)
+)
+_CONFIRM_WINDOW_VALIDATOR = vol.All(vol.Coerce(int), vol.Range(min=MIN_CONFIRM_WINDOW))
+_NAME_VALIDATOR = vol.All(cv.string, vol.Length(max=MAX_NAME_LENGTH))
+_DESC_VALIDATOR = vol.All(cv.string, vol.Length(max=MAX_DESCRIPTION_LENGTH))
+_STRING_LIST_VALIDATOR = vol.All(cv.ensure_list, [cv.string])
+_SECONDS_LIST_VALIDATOR = vol.All(cv.ensure_list, [vol.Coerce(int)])
+
+# Per-routine notification override; keys left out fall back to defaults
+_NOTIFICATION_SETTINGS_SCHEMA = vol.Schema(
+    {
+        vol.Optional("notify_before"): _SECONDS_LIST_VALIDATOR,
+        vol.Optional("notify_on_start"): cv.boolean,
+        vol.Optional("notify_remaining"): _SECONDS_LIST_VALIDATOR,
+        vol.Optional("notify_overdue"): _SECONDS_LIST_VALIDATOR,
+        vol.Optional("notify_on_complete"): cv.boolean,
+        vol.Optional("autonext_notify_before"): _SECONDS_LIST_VALIDATOR,
+        vol.Optional("autonext_notify_remaining"): _SECONDS_LIST_VALIDATOR,
+        vol.Optional("notification_targets"): vol.Maybe(cv.string),
+    },
+    extra=vol.REMOVE_EXTRA,
+)
+
 # Service schemas
 SCHEMA_CREATE_TASK = vol.Schema(
     {
         vol.Required(ATTR_TASK_NAME): cv.string,
-        vol.Required(ATTR_DURATION): vol.All(
-            vol.Coerce(int), vol.Range(min=MIN_TASK_DURATION, max=MAX_TASK_DURATION)
-        ),
+        vol.Required(ATTR_DURATION): _DURATION_VALIDATOR,
         vol.Optional(ATTR_ICON): cv.string,
         vol.Optional(ATTR_ADVANCEMENT_MODE, default=DEFAULT_ADVANCEMENT_MODE): vol.In(
-            [m.value for m in AdvancementMode]
-        ),
-        vol.Optional(ATTR_CONFIRM_WINDOW): vol.All(
-            vol.Coerce(int), vol.Range(min=MIN_CONFIRM_WINDOW)
-        ),
-        vol.Optional(ATTR_DESCRIPTION): vol.All(
-            cv.string, vol.Length(max=MAX_DESCRIPTION_LENGTH)
-        ),
-        vol.Optional(ATTR_NOTIFICATION_MESSAGE): vol.All(
-            cv.string, vol.Length(max=MAX_DESCRIPTION_LENGTH)
-        ),
-        vol.Optional(ATTR_TTS_MESSAGE): vol.All(
-            cv.string, vol.Length(max=MAX_DESCRIPTION_LENGTH)
+            _ADVANCEMENT_MODE_VALUES
         ),
+        vol.Optional(ATTR_CONFIRM_WINDOW): _CONFIRM_WINDOW_VALIDATOR,
+        vol.Optional(ATTR_DESCRIPTION): _DESC_VALIDATOR,
+        vol.Optional(ATTR_NOTIFICATION_MESSAGE): _DESC_VALIDATOR,
+        vol.Optional(ATTR_TTS_MESSAGE): _DESC_VALIDATOR,
     }
 )
 
 SCHEMA_UPDATE_TASK = vol.Schema(
     {
         vol.Required(ATTR_TASK_ID): cv.string,
-        vol.Optional(ATTR_TASK_NAME): vol.All(
-            cv.string, vol.Length(max=MAX_NAME_LENGTH)
-        ),
-        vol.Optional(ATTR_DURATION): vol.All(
-            vol.Coerce(int), vol.Range(min=MIN_TASK_DURATION, max=MAX_TASK_DURATION)
-        ),
+        vol.Optional(ATTR_TASK_NAME): _NAME_VALIDATOR,
+        vol.Optional(ATTR_DURATION): _DURATION_VALIDATOR,
         vol.Optional(ATTR_ICON): cv.string,
-        vol.Optional(ATTR_ADVANCEMENT_MODE): vol.In(
-            [m.value for m in AdvancementMode]
-        ),
-        vol.Optional(ATTR_CONFIRM_WINDOW): vol.All(
-            vol.Coerce(int), vol.Range(min=MIN_CONFIRM_WINDOW)
-        ),
-        vol.Optional(ATTR_DESCRIPTION): vol.All(
-            cv.string, vol.Length(max=MAX_DESCRIPTION_LENGTH)
-        ),
-        vol.Optional(ATTR_NOTIFICATION_MESSAGE): vol.All(
-            cv.string, vol.Length(max=MAX_DESCRIPTION_LENGTH)
-        ),
-        vol.Optional(ATTR_TTS_MESSAGE): vol.All(
-            cv.string, vol.Length(max=MAX_DESCRIPTION_LENGTH)
-        ),
+        vol.Optional(ATTR_ADVANCEMENT_MODE): vol.In(_ADVANCEMENT_MODE_VALUES),
+        vol.Optional(ATTR_CONFIRM_WINDOW): _CONFIRM_WINDOW_VALIDATOR,
+        vol.Optional(ATTR_DESCRIPTION): _DESC_VALIDATOR,
+        vol.Optional(ATTR_NOTIFICATION_MESSAGE): _DESC_VALIDATOR,
+        vol.Optional(ATTR_TTS_MESSAGE): _DESC_VALIDATOR,
     }
 )
 
@@ -124,30 +127,26 @@ SCHEMA_DELETE_TASK = vol.Schema({vol.Required(ATTR_TASK_ID): cv.string})
 
 SCHEMA_CREATE_ROUTINE = vol.Schema(
     {
-        vol.Required(ATTR_ROUTINE_NAME): vol.All(
-            cv.string, vol.Length(max=MAX_NAME_LENGTH)
-        ),
+        vol.Required(ATTR_ROUTINE_NAME): _NAME_VALIDATOR,
         vol.Optional(ATTR_ICON): cv.string,
-        vol.Optional(ATTR_TASK_IDS): vol.All(cv.ensure_list, [cv.string]),
-        vol.Optional("tags"): vol.All(cv.ensure_list, [cv.string]),
-        vol.Optional("schedule_time"): vol.Any(cv.string, None),
-        vol.Optional("schedule_days"): vol.All(cv.ensure_list, [cv.string]),
-        vol.Optional("notification_settings"): vol.Any(dict, None),
+        vol.Optional(ATTR_TASK_IDS): _STRING_LIST_VALIDATOR,
+        vol.Optional("tags"): _STRING_LIST_VALIDATOR,
+        vol.Optional("schedule_time"): vol.Maybe(cv.string),
+        vol.Optional("schedule_days"): _STRING_LIST_VALIDATOR,
+        vol.Optional("notification_settings"): vol.Maybe(_NOTIFICATION_SETTINGS_SCHEMA),
     }
 )
 
 SCHEMA_UPDATE_ROUTINE = vol.Schema(
     {
         vol.Required(ATTR_ROUTINE_ID): cv.string,
-        vol.Optional(ATTR_ROUTINE_NAME): vol.All(
-            cv.string, vol.Length(max=MAX_NAME_LENGTH)
-        ),
+        vol.Optional(ATTR_ROUTINE_NAME): _NAME_VALIDATOR,
         vol.Optional(ATTR_ICON): cv.string,
-        vol.Optional(ATTR_TASK_IDS): vol.All(cv.ensure_list, [cv.string]),
-        vol.Optional("tags"): vol.All(cv.ensure_list, [cv.string]),
-        vol.Optional("schedule_time"): vol.Any(cv.string, None),
-        vol.Optional("schedule_days"): vol.All(cv.ensure_list, [cv.string]),
-        vol.Optional("notification_settings"): vol.Any(dict, None),
+        vol.Optional(ATTR_TASK_IDS): _STRING_LIST_VALIDATOR,
+        vol.Optional("tags"): _STRING_LIST_VALIDATOR,
+        vol.Optional("schedule_time"): vol.Maybe(cv.string),
+        vol.Optional("schedule_days"): _STRING_LIST_VALIDATOR,
+        vol.Optional("notification_settings"): vol.Maybe(_NOTIFICATION_SETTINGS_SCHEMA),
     }
 )
 
@@ -171,14 +170,14 @@ SCHEMA_REMOVE_TASK_FROM_ROUTINE = vol.Schema(
 SCHEMA_REORDER_ROUTINE = vol.Schema(
     {
         vol.Required(ATTR_ROUTINE_ID): cv.string,
-        vol.Required(ATTR_TASK_IDS): vol.All(cv.ensure_list, [cv.string]),
+        vol.Required(ATTR_TASK_IDS): _STRING_LIST_VALIDATOR,
     }
 )
 
 SCHEMA_START = vol.Schema({
     vol.Required(ATTR_ROUTINE_ID): cv.string,
-    vol.Optional("skip_task_ids"): vol.All(cv.ensure_list, [cv.string]),
-    vol.Optional("task_order"): vol.All(cv.ensure_list, [cv.string]),
+    vol.Optional("skip_task_ids"): _STRING_LIST_VALIDATOR,
+    vol.Optional("task_order"): _STRING_LIST_VALIDATOR,
 })
 
 SCHEMA_SNOOZE = vol.Schema(
@@ -193,6 +192,67 @@ SCHEMA_TEST_NOTIFICATION = vol.Schema(
     {vol.Optional("message", default="This is a test notification from Routinely"): cv.string}
 )
 
+# Every service registered by async_setup_services
+_ALL_SERVICES = (
+    SERVICE_CREATE_TASK,
+    SERVICE_UPDATE_TASK,
+    SERVICE_DELETE_TASK,
+    SERVICE_CREATE_ROUTINE,
+    SERVICE_UPDATE_ROUTINE,
+    SERVICE_DELETE_ROUTINE,
+    SERVICE_ADD_TASK_TO_ROUTINE,
+    SERVICE_REMOVE_TASK_FROM_ROUTINE,
+    SERVICE_REORDER_ROUTINE,
+    SERVICE_START,
+    SERVICE_PAUSE,
+    SERVICE_RESUME,
+    SERVICE_SKIP,
+    SERVICE_COMPLETE_TASK,
+    SERVICE_CONFIRM,
+    SERVICE_SNOOZE,
+    SERVICE_CANCEL,
+    SERVICE_ADJUST_TIME,
+    SERVICE_TEST_NOTIFICATION,
+)
+
+
+def _notification_settings(data: dict[str, Any] | None) -> NotificationSettings | None:
+    """Parse a routine's notification override; empty means use global defaults."""
+    return NotificationSettings.from_dict(data) if data else None
+
+
+# (service field, model attribute, converter) applied by the update handlers
+_TASK_UPDATE_FIELDS = (
+    (ATTR_TASK_NAME, "name", None),
+    (ATTR_DURATION, "duration", None),
+    (ATTR_ICON, "icon", None),
+    (ATTR_ADVANCEMENT_MODE, "advancement_mode", AdvancementMode),
+    (ATTR_CONFIRM_WINDOW, "confirm_window", None),
+    (ATTR_DESCRIPTION, "description", None),
+    (ATTR_NOTIFICATION_MESSAGE, "notification_message", None),
+    (ATTR_TTS_MESSAGE, "tts_message", None),
+)
+_ROUTINE_UPDATE_FIELDS = (
+    (ATTR_ROUTINE_NAME, "name", None),
+    (ATTR_ICON, "icon", None),
+    ("tags", "tags", None),
+    ("schedule_time", "schedule_time", None),
+    ("schedule_days", "schedule_days", None),
+    ("notification_settings", "notification_settings", _notification_settings),
+)
+
+
+def _apply_fields(
+    target: Any,
+    data: Mapping[str, Any],
+    fields: tuple[tuple[str, str, Callable[[Any], Any] | None], ...],
+) -> None:
+    """Copy the fields present in service call data onto a model."""
+    for key, attr, convert in fields:
+        if key in data:
+            value = data[key]
+            setattr(target, attr, convert(value) if convert else value)
+
 
 async def async_setup_services(
     hass: HomeAssistant,
@@ -227,24 +287,14 @@ async def async_setup_services(
             _log.error("Task not found", task_id=task_id)
             return
 
-        if ATTR_TASK_NAME in call.data:
-            task.name = call.data[ATTR_TASK_NAME]
-        if ATTR_DURATION in call.data:
-            task.duration = call.data[ATTR_DURATION]
-        if ATTR_ICON in call.data:
-            task.icon = call.data[ATTR_ICON]
-        if ATTR_ADVANCEMENT_MODE in call.data:
-            task.advancement_mode = AdvancementMode(call.data[ATTR_ADVANCEMENT_MODE])
-        if ATTR_CONFIRM_WINDOW in call.data:
-            task.confirm_window = call.data[ATTR_CONFIRM_WINDOW]
-        if ATTR_DESCRIPTION in call.data:
-            task.description = call.data[ATTR_DESCRIPTION]
-        if ATTR_NOTIFICATION_MESSAGE in call.data:
-            task.notification_message = call.data[ATTR_NOTIFICATION_MESSAGE]
-        if ATTR_TTS_MESSAGE in call.data:
-            task.tts_message = call.data[ATTR_TTS_MESSAGE]
-
-        task.updated_at = datetime.now().isoformat()
+        original = copy(task)
+        _apply_fields(task, call.data, _TASK_UPDATE_FIELDS)
+
+        if task == original:
+            _log.debug("Task unchanged, skipping update", task_id=task_id)
+            return
+
+        task.updated_at = now_iso()
         await storage.async_update_task(task)
         _log.info("Updated task", name=task.name)
 
@@ -261,16 +311,9 @@ async def async_setup_services(
         """Handle create_routine service call."""
         task_ids = call.data.get(ATTR_TASK_IDS, [])
         # Validate task IDs exist
-        for tid in task_ids:
-            if not storage.get_task(tid):
-                _log.error("Task not found", task_id=tid)
-                return
-
-        # Process notification settings if provided
-        notification_settings = None
-        ns_data = call.data.get("notification_settings")
-        if ns_data:
-            notification_settings = NotificationSettings.from_dict(ns_data)
+        if missing := storage.missing_task_ids(task_ids):
+            _log.error("Tasks not found", task_ids=missing)
+            return
 
         routine = Routine(
             id=generate_id(),
@@ -280,7 +323,9 @@ async def async_setup_services(
             tags=call.data.get("tags", []),
             schedule_time=call.data.get("schedule_time"),
             schedule_days=call.data.get("schedule_days", []),
-            notification_settings=notification_settings,
+            notification_settings=_notification_settings(
+                call.data.get("notification_settings")
+            ),
         )
         await storage.async_create_routine(routine)
         _log.info("Created routine", name=routine.name, id=routine.id)
@@ -288,41 +333,30 @@ async def async_setup_services(
     async def handle_update_routine(call: ServiceCall) -> None:
         """Handle update_routine service call."""
         routine_id = call.data[ATTR_ROUTINE_ID]
+        if coordinator.engine.is_active and coordinator.engine.session.routine_id == routine_id:
+            _log.error("Cannot update routine while it is active")
+            return
+
         routine = storage.get_routine(routine_id)
         if not routine:
             _log.error("Routine not found", routine_id=routine_id)
             return
 
-        if coordinator.engine.is_active and coordinator.engine.session.routine_id == routine_id:
-            _log.error("Cannot update routine while it is active")
-            return
-
-        if ATTR_ROUTINE_NAME in call.data:
-            routine.name = call.data[ATTR_ROUTINE_NAME]
-        if ATTR_ICON in call.data:
-            routine.icon = call.data[ATTR_ICON]
-        if ATTR_TASK_IDS in call.data:
+        original = copy(routine)
+        _apply_fields(routine, call.data, _ROUTINE_UPDATE_FIELDS)
+        task_ids = call.data.get(ATTR_TASK_IDS)
+        if task_ids is not None and task_ids != routine.task_ids:
             # Validate task IDs exist
-            task_ids = call.data[ATTR_TASK_IDS]
-            for tid in task_ids:
-                if not storage.get_task(tid):
-                    _log.error("Task not found", task_id=tid)
-                    return
+            if missing := storage.missing_task_ids(task_ids):
+                _log.error("Tasks not found", task_ids=missing)
+                return
             routine.task_ids = task_ids
-        if "tags" in call.data:
-            routine.tags = call.data["tags"]
-        if "schedule_time" in call.data:
-            routine.schedule_time = call.data["schedule_time"]
-        if "schedule_days" in call.data:
-            routine.schedule_days = call.data["schedule_days"]
-        if "notification_settings" in call.data:
-            ns_data = call.data["notification_settings"]
-            if ns_data:
-                routine.notification_settings = NotificationSettings.from_dict(ns_data)
-            else:
-                routine.notification_settings = None  # Use global defaults
-
-        routine.updated_at = datetime.now().isoformat()
+
+        if routine == original:
+            _log.debug("Routine unchanged, skipping update", routine_id=routine_id)
+            return
+
+        routine.updated_at = now_iso()
         await storage.async_update_routine(routine)
         _log.info("Updated routine", name=routine.name)
 
@@ -341,6 +375,10 @@ async def async_setup_services(
         task_id = call.data[ATTR_TASK_ID]
         position = call.data.get(ATTR_POSITION)
 
+        if coordinator.engine.is_active and coordinator.engine.session.routine_id == routine_id:
+            _log.error("Cannot modify routine while it is active")
+            return
+
         routine = storage.get_routine(routine_id)
         if not routine:
             _log.error("Routine not found", routine_id=routine_id)
@@ -350,16 +388,12 @@ async def async_setup_services(
             _log.error("Task not found", task_id=task_id)
             return
 
-        if coordinator.engine.is_active and coordinator.engine.session.routine_id == routine_id:
-            _log.error("Cannot modify routine while it is active")
-            return
-
         if position is not None and 0 <= position <= len(routine.task_ids):
             routine.task_ids.insert(position, task_id)
         else:
             routine.task_ids.append(task_id)
 
-        routine.updated_at = datetime.now().isoformat()
+        routine.updated_at = now_iso()
         await storage.async_update_routine(routine)
         _log.info("Added task to routine", task_id=task_id, routine_id=routine_id)
 
@@ -368,18 +402,18 @@ async def async_setup_services(
         routine_id = call.data[ATTR_ROUTINE_ID]
         position = call.data[ATTR_POSITION]
 
+        if coordinator.engine.is_active and coordinator.engine.session.routine_id == routine_id:
+            _log.error("Cannot modify routine while it is active")
+            return
+
         routine = storage.get_routine(routine_id)
         if not routine:
             _log.error("Routine not found", routine_id=routine_id)
             return
 
-        if coordinator.engine.is_active and coordinator.engine.session.routine_id == routine_id:
-            _log.error("Cannot modify routine while it is active")
-            return
-
         if 0 <= position < len(routine.task_ids):
             routine.task_ids.pop(position)
-            routine.updated_at = datetime.now().isoformat()
+            routine.updated_at = now_iso()
             await storage.async_update_routine(routine)
             _log.info("Removed task from routine", position=position, routine_id=routine_id)
         else:
@@ -390,23 +424,22 @@ async def async_setup_services(
         routine_id = call.data[ATTR_ROUTINE_ID]
         task_ids = call.data[ATTR_TASK_IDS]
 
+        if coordinator.engine.is_active and coordinator.engine.session.routine_id == routine_id:
+            _log.error("Cannot modify routine while it is active")
+            return
+
         routine = storage.get_routine(routine_id)
         if not routine:
             _log.error("Routine not found", routine_id=routine_id)
             return
 
-        if coordinator.engine.is_active and coordinator.engine.session.routine_id == routine_id:
-            _log.error("Cannot modify routine while it is active")
-            return
-
         # Validate all task IDs exist
-        for tid in task_ids:
-            if not storage.get_task(tid):
-                _log.error("Task not found", task_id=tid)
-                return
+        if missing := storage.missing_task_ids(task_ids):
+            _log.error("Tasks not found", task_ids=missing)
+            return
 
         routine.task_ids = task_ids
-        routine.updated_at = datetime.now().isoformat()
+        routine.updated_at = now_iso()
         await storage.async_update_routine(routine)
         _log.info("Reordered routine", routine_id=routine_id)
 
@@ -484,50 +517,33 @@ async def async_setup_services(
         _log.info("Test notification sent", message=message)
 
     # Register services
-    hass.services.async_register(DOMAIN, SERVICE_CREATE_TASK, handle_create_task, SCHEMA_CREATE_TASK)
-    hass.services.async_register(DOMAIN, SERVICE_UPDATE_TASK, handle_update_task, SCHEMA_UPDATE_TASK)
-    hass.services.async_register(DOMAIN, SERVICE_DELETE_TASK, handle_delete_task, SCHEMA_DELETE_TASK)
-    hass.services.async_register(DOMAIN, SERVICE_CREATE_ROUTINE, handle_create_routine, SCHEMA_CREATE_ROUTINE)
-    hass.services.async_register(DOMAIN, SERVICE_UPDATE_ROUTINE, handle_update_routine, SCHEMA_UPDATE_ROUTINE)
-    hass.services.async_register(DOMAIN, SERVICE_DELETE_ROUTINE, handle_delete_routine, SCHEMA_DELETE_ROUTINE)
-    hass.services.async_register(DOMAIN, SERVICE_ADD_TASK_TO_ROUTINE, handle_add_task_to_routine, SCHEMA_ADD_TASK_TO_ROUTINE)
-    hass.services.async_register(DOMAIN, SERVICE_REMOVE_TASK_FROM_ROUTINE, handle_remove_task_from_routine, SCHEMA_REMOVE_TASK_FROM_ROUTINE)
-    hass.services.async_register(DOMAIN, SERVICE_REORDER_ROUTINE, handle_reorder_routine, SCHEMA_REORDER_ROUTINE)
-    hass.services.async_register(DOMAIN, SERVICE_START, handle_start, SCHEMA_START)
-    hass.services.async_register(DOMAIN, SERVICE_PAUSE, handle_pause)
-    hass.services.async_register(DOMAIN, SERVICE_RESUME, handle_resume)
-    hass.services.async_register(DOMAIN, SERVICE_SKIP, handle_skip)
-    hass.services.async_register(DOMAIN, SERVICE_COMPLETE_TASK, handle_complete_task)
-    hass.services.async_register(DOMAIN, SERVICE_CONFIRM, handle_confirm)
-    hass.services.async_register(DOMAIN, SERVICE_SNOOZE, handle_snooze, SCHEMA_SNOOZE)
-    hass.services.async_register(DOMAIN, SERVICE_CANCEL, handle_cancel)
-    hass.services.async_register(DOMAIN, SERVICE_ADJUST_TIME, handle_adjust_time, SCHEMA_ADJUST_TIME)
-    hass.services.async_register(DOMAIN, SERVICE_TEST_NOTIFICATION, handle_test_notification, SCHEMA_TEST_NOTIFICATION)
+    services = (
+        (SERVICE_CREATE_TASK, handle_create_task, SCHEMA_CREATE_TASK),
+        (SERVICE_UPDATE_TASK, handle_update_task, SCHEMA_UPDATE_TASK),
+        (SERVICE_DELETE_TASK, handle_delete_task, SCHEMA_DELETE_TASK),
+        (SERVICE_CREATE_ROUTINE, handle_create_routine, SCHEMA_CREATE_ROUTINE),
+        (SERVICE_UPDATE_ROUTINE, handle_update_routine, SCHEMA_UPDATE_ROUTINE),
+        (SERVICE_DELETE_ROUTINE, handle_delete_routine, SCHEMA_DELETE_ROUTINE),
+        (SERVICE_ADD_TASK_TO_ROUTINE, handle_add_task_to_routine, SCHEMA_ADD_TASK_TO_ROUTINE),
+        (SERVICE_REMOVE_TASK_FROM_ROUTINE, handle_remove_task_from_routine, SCHEMA_REMOVE_TASK_FROM_ROUTINE),
+        (SERVICE_REORDER_ROUTINE, handle_reorder_routine, SCHEMA_REORDER_ROUTINE),
+        (SERVICE_START, handle_start, SCHEMA_START),
+        (SERVICE_PAUSE, handle_pause, None),
+        (SERVICE_RESUME, handle_resume, None),
+        (SERVICE_SKIP, handle_skip, None),
+        (SERVICE_COMPLETE_TASK, handle_complete_task, None),
+        (SERVICE_CONFIRM, handle_confirm, None),
+        (SERVICE_SNOOZE, handle_snooze, SCHEMA_SNOOZE),
+        (SERVICE_CANCEL, handle_cancel, None),
+        (SERVICE_ADJUST_TIME, handle_adjust_time, SCHEMA_ADJUST_TIME),
+        (SERVICE_TEST_NOTIFICATION, handle_test_notification, SCHEMA_TEST_NOTIFICATION),
+    )
+    for name, handler, schema in services:
+        hass.services.async_register(DOMAIN, name, handler, schema)
 
 
 @callback
 def async_unload_services(hass: HomeAssistant) -> None:
     """Unload Routinely services."""
-    services = [
-        SERVICE_CREATE_TASK,
-        SERVICE_UPDATE_TASK,
-        SERVICE_DELETE_TASK,
-        SERVICE_CREATE_ROUTINE,
-        SERVICE_UPDATE_ROUTINE,
-        SERVICE_DELETE_ROUTINE,
-        SERVICE_ADD_TASK_TO_ROUTINE,
-        SERVICE_REMOVE_TASK_FROM_ROUTINE,
-        SERVICE_REORDER_ROUTINE,
-        SERVICE_START,
-        SERVICE_PAUSE,
-        SERVICE_RESUME,
-        SERVICE_SKIP,
-        SERVICE_COMPLETE_TASK,
-        SERVICE_CONFIRM,
-        SERVICE_SNOOZE,
-        SERVICE_CANCEL,
-        SERVICE_ADJUST_TIME,
-        SERVICE_TEST_NOTIFICATION,
-    ]
-    for service in services:
+    for service in _ALL_SERVICES:
         hass.services.async_remove(DOMAIN, service)
@@ -1,6 +1,8 @@
 """Storage handler for the Routinely integration."""
 from __future__ import annotations
 
+from collections import deque
+from itertools import islice
 from typing import TYPE_CHECKING, Any
 
 from homeassistant.helpers.storage import Store
@@ -10,11 +12,15 @@ from .logger import Loggers
 from .models import Routine, SessionHistory, Task
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
     from homeassistant.core import HomeAssistant
 
 _log = Loggers.storage
 
 MAX_HISTORY_ENTRIES = 100
+# Seconds to coalesce bursts of mutations (e.g. drag-reordering) into one write
+SAVE_DELAY = 1
 
 
 class RoutinelyStorage:
@@ -27,10 +33,19 @@ class RoutinelyStorage:
         self._data: dict[str, Any] = {
             "tasks": {},
             "routines": {},
-            "history": [],
+            # Newest first; kept as a bounded deque in memory, a list on disk
+            "history": deque(maxlen=MAX_HISTORY_ENTRIES),
             "settings": {},
         }
+        # Direct reference to the settings dict, rebound on load
+        self._settings: dict[str, Any] = self._data["settings"]
         self._loaded = False
+        # Bumped whenever settings change so readers can drop cached values
+        self.settings_version = 0
+        # Bumped on every load and save so readers can cache derived views
+        self.revision = 0
+        # Whether a delayed save is scheduled but not yet written
+        self._save_pending = False
         _log.debug("Storage handler initialized", storage_key=STORAGE_KEY)
 
     async def async_load(self) -> None:
@@ -42,23 +57,50 @@ class RoutinelyStorage:
         _log.debug("Loading storage data")
         data = await self._store.async_load()
         if data:
+            data["history"] = deque(
+                islice(data.get("history", ()), MAX_HISTORY_ENTRIES),
+                maxlen=MAX_HISTORY_ENTRIES,
+            )
             self._data = data
+            self._settings = data.setdefault("settings", {})
+            self.settings_version += 1
+            self.revision += 1
             _log.debug(
                 "Storage data loaded",
                 tasks=len(self._data.get("tasks", {})),
                 routines=len(self._data.get("routines", {})),
-                history_entries=len(self._data.get("history", [])),
+                history_entries=len(self._data["history"]),
             )
         else:
             _log.debug("No existing storage data found, using defaults")
         self._loaded = True
 
     async def async_save(self) -> None:
-        """Save data to storage."""
+        """Save data to storage immediately, superseding any delayed save."""
+        self.revision += 1
         _log.debug("Saving storage data")
-        await self._store.async_save(self._data)
+        await self._store.async_save(self._get_data())
         _log.debug("Storage data saved")
 
+    def async_delay_save(self) -> None:
+        """Schedule a save, coalescing mutations made within SAVE_DELAY seconds.
+
+        Store writes pending delayed saves itself when Home Assistant stops.
+        """
+        self.revision += 1
+        self._save_pending = True
+        self._store.async_delay_save(self._get_data, SAVE_DELAY)
+
+    async def async_flush(self) -> None:
+        """Write a pending delayed save now (e.g. before the entry unloads)."""
+        if self._save_pending:
+            await self.async_save()
+
+    def _get_data(self) -> dict[str, Any]:
+        """Return the data to write, with history as a JSON-serializable list."""
+        self._save_pending = False
+        return {**self._data, "history": list(self._data["history"])}
+
     # Task operations
     def get_tasks(self) -> dict[str, Task]:
         """Get all tasks."""
@@ -72,49 +114,50 @@ class RoutinelyStorage:
         task_data = self._data["tasks"].get(task_id)
         return Task.from_dict(task_data) if task_data else None
 
+    def missing_task_ids(self, task_ids: Iterable[str]) -> list[str]:
+        """Return the IDs from task_ids that have no stored task."""
+        tasks = self._data["tasks"]
+        return [task_id for task_id in task_ids if task_id not in tasks]
+
     async def async_create_task(self, task: Task) -> Task:
         """Create a new task."""
-        _log.debug("Creating task", task_id=task.id, name=task.name)
         self._data["tasks"][task.id] = task.to_dict()
-        await self.async_save()
+        self.async_delay_save()
         _log.info("Task created", task_id=task.id, name=task.name)
         return task
 
     async def async_update_task(self, task: Task) -> Task:
         """Update an existing task."""
-        if task.id not in self._data["tasks"]:
+        tasks = self._data["tasks"]
+        if task.id not in tasks:
             _log.error("Task not found for update", task_id=task.id)
             raise ValueError(f"Task {task.id} not found")
-        _log.debug("Updating task", task_id=task.id, name=task.name)
-        self._data["tasks"][task.id] = task.to_dict()
-        await self.async_save()
+        tasks[task.id] = task.to_dict()
+        self.async_delay_save()
         _log.info("Task updated", task_id=task.id, name=task.name)
         return task
 
     async def async_delete_task(self, task_id: str) -> None:
         """Delete a task."""
-        if task_id in self._data["tasks"]:
-            task_name = self._data["tasks"][task_id].get("name", "unknown")
-            _log.debug("Deleting task", task_id=task_id, name=task_name)
-            del self._data["tasks"][task_id]
-            # Remove from all routines
-            affected_routines = 0
-            for routine_data in self._data["routines"].values():
-                old_len = len(routine_data["task_ids"])
-                routine_data["task_ids"] = [
-                    tid for tid in routine_data["task_ids"] if tid != task_id
-                ]
-                if len(routine_data["task_ids"]) < old_len:
-                    affected_routines += 1
-            await self.async_save()
-            _log.info(
-                "Task deleted",
-                task_id=task_id,
-                name=task_name,
-                affected_routines=affected_routines,
-            )
-        else:
+        task_data = self._data["tasks"].pop(task_id, None)
+        if task_data is None:
             _log.warning("Attempted to delete non-existent task", task_id=task_id)
+            return
+        task_name = task_data.get("name", "unknown")
+        # Remove from all routines
+        affected_routines = 0
+        for routine_data in self._data["routines"].values():
+            task_ids = routine_data["task_ids"]
+            if task_id in task_ids:
+                routine_data["task_ids"] = [tid for tid in task_ids if tid != task_id]
+                affected_routines += 1
+        self.async_delay_save()
+        _log.info(
+            "Task deleted",
+            task_id=task_id,
+            name=task_name,
+            affected_routines=affected_routines,
+        )
 
     # Routine operations
     def get_routines(self) -> dict[str, Routine]:
@@ -131,77 +174,77 @@ class RoutinelyStorage:
 
     async def async_create_routine(self, routine: Routine) -> Routine:
         """Create a new routine."""
-        _log.debug(
-            "Creating routine",
+        self._data["routines"][routine.id] = routine.to_dict()
+        self.async_delay_save()
+        _log.info(
+            "Routine created",
             routine_id=routine.id,
             name=routine.name,
             task_count=len(routine.task_ids),
         )
-        self._data["routines"][routine.id] = routine.to_dict()
-        await self.async_save()
-        _log.info("Routine created", routine_id=routine.id, name=routine.name)
         return routine
 
     async def async_update_routine(self, routine: Routine) -> Routine:
         """Update an existing routine."""
-        if routine.id not in self._data["routines"]:
+        routines = self._data["routines"]
+        if routine.id not in routines:
             _log.error("Routine not found for update", routine_id=routine.id)
             raise ValueError(f"Routine {routine.id} not found")
-        _log.debug("Updating routine", routine_id=routine.id, name=routine.name)
-        self._data["routines"][routine.id] = routine.to_dict()
-        await self.async_save()
+        routines[routine.id] = routine.to_dict()
+        self.async_delay_save()
         _log.info("Routine updated", routine_id=routine.id, name=routine.name)
         return routine
 
     async def async_delete_routine(self, routine_id: str) -> None:
         """Delete a routine."""
-        if routine_id in self._data["routines"]:
-            routine_name = self._data["routines"][routine_id].get("name", "unknown")
-            _log.debug("Deleting routine", routine_id=routine_id, name=routine_name)
-            del self._data["routines"][routine_id]
-            await self.async_save()
-            _log.info("Routine deleted", routine_id=routine_id, name=routine_name)
-        else:
+        routine_data = self._data["routines"].pop(routine_id, None)
+        if routine_data is None:
             _log.warning("Attempted to delete non-existent routine", routine_id=routine_id)
+            return
+        routine_name = routine_data.get("name", "unknown")
+        self.async_delay_save()
+        _log.info("Routine deleted", routine_id=routine_id, name=routine_name)
 
     # History operations
     def get_history(self, limit: int = 50) -> list[SessionHistory]:
         """Get session history."""
-        history_data = self._data.get("history", [])[:limit]
+        history_data = list(islice(self._data["history"], limit))
         _log.debug("Retrieved history", count=len(history_data), limit=limit)
         return [SessionHistory.from_dict(h) for h in history_data]
 
     async def async_add_history(self, session: SessionHistory) -> None:
         """Add a session to history."""
-        _log.debug(
-            "Adding session to history",
+        # The bounded deque drops the oldest entry once full
+        self._data["history"].appendleft(session.to_dict())
+        self.async_delay_save()
+        _log.info(
+            "Session added to history",
             session_id=session.id,
             routine=session.routine_name,
             status=session.status.value,
         )
-        self._data["history"].insert(0, session.to_dict())
-        # Trim to max entries
-        old_len = len(self._data["history"])
-        self._data["history"] = self._data["history"][:MAX_HISTORY_ENTRIES]
-        trimmed = old_len - len(self._data["history"])
-        if trimmed > 0:
-            _log.debug("Trimmed history entries", trimmed=trimmed)
-        await self.async_save()
-        _log.info("Session added to history", session_id=session.id)
 
     # Settings operations
     def get_settings(self) -> dict[str, Any]:
         """Get all settings."""
-        return self._data.get("settings", {})
+        return self._settings
 
     def get_setting(self, key: str, default: Any = None) -> Any:
         """Get a single setting."""
-        return self._data.get("settings", {}).get(key, default)
+        return self._settings.get(key, default)
 
     async def async_update_settings(self, settings: dict[str, Any]) -> None:
-        """Update settings."""
-        self._data["settings"].update(settings)
-        await self.async_save()
+        """Update settings, skipping the save when nothing changes.
+
+        Setup re-applies the entry options on every start, which is usually
+        a no-op.
+        """
+        current = self._settings
+        if all(key in current and current[key] == value for key, value in settings.items()):
+            return
+        current.update(settings)
+        self.settings_version += 1
+        self.async_delay_save()
 
     # Utility
     def calculate_routine_duration(self, routine: Routine, skip_task_ids: list[str] | None = None) -> int:
@@ -211,15 +254,14 @@ class RoutinelyStorage:
             routine: The routine to calculate duration for
             skip_task_ids: Optional list of task IDs to exclude from calculation
         """
-        skip_task_ids = skip_task_ids or []
-        total = 0
-        for task_id in routine.task_ids:
-            if task_id in skip_task_ids:
-                continue
-            task = self.get_task(task_id)
-            if task:
-                total += task.duration
-        return total
+        # Read durations straight from the stored dicts; no Task needs building
+        tasks = self._data["tasks"]
+        skip = frozenset(skip_task_ids) if skip_task_ids else frozenset()
+        return sum(
+            tasks[task_id]["duration"]
+            for task_id in routine.task_ids
+            if task_id in tasks and task_id not in skip
+        )
 
     def get_routine_tasks(self, routine: Routine) -> list[Task]:
         """Get all tasks for a routine in order."""